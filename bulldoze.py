@@ -4,27 +4,60 @@ Handles drag bulldozing with red grid highlighting and confirm button.
 """
 
 import pygame
-from typing import Set, Tuple, Optional
+from array import array
+from typing import Dict, Iterable, Iterator, Set, Tuple, Optional
+from cell_keys import pack_cell
 
 # Colors for bulldoze mode
 BULLDOZE_HIGHLIGHT = (200, 50, 50, 100)  # Semi-transparent red
+BULLDOZE_BORDER = (255, 100, 100)
+LAYER_COLORKEY = (0, 0, 0)  # Transparent pixels in the highlight layers
 BULLDOZE_CONFIRM_BG = (180, 40, 40)
 BULLDOZE_CONFIRM_BORDER = (220, 80, 80)
 
 class BulldozeManager:
-    def __init__(self):
+    def __init__(self) -> None:
         self.is_dragging = False
         self.drag_start_cell: Optional[Tuple[int, int]] = None
         self.drag_end_cell: Optional[Tuple[int, int]] = None
-        self.highlighted_cells: Set[Tuple[int, int]] = set()
+        # Cells stored as packed int keys (see cell_keys.pack_cell)
+        self.highlighted_cells: Set[int] = set()
+        # Coordinates of highlighted cells in insertion order (structure of arrays)
+        self._xs = array('i')
+        self._ys = array('i')
+        self._last_added_cell: Optional[Tuple[int, int]] = None
+        # Drag bounding box in cells: (min_x, min_y, max_x, max_y)
+        self._bbox: Optional[Tuple[int, int, int, int]] = None
+        # Row bitmap of highlighted cells: y -> int with bit (x - _bit_origin) set
+        self._row_bits: Dict[int, int] = {}
+        self._bit_origin = 0
         self.confirm_rect: Optional[pygame.Rect] = None
+        self._confirm_cache: Optional[Tuple[int, int, pygame.Rect]] = None
+        # Rendered "CONFIRM" label, re-rendered only if a different font is passed
+        self._confirm_label: Optional[pygame.Surface] = None
+        self._confirm_font_id: Optional[int] = None
+        # Viewport-sized highlight layers; new cells are painted into them incrementally.
+        # Tint uses whole-surface alpha and borders are opaque, so neither needs per-pixel alpha.
+        self._overlay: Optional[pygame.Surface] = None
+        self._border_layer: Optional[pygame.Surface] = None
+        self._overlay_view: Optional[Tuple[int, int, int, int, int]] = None
+        self._overlay_stale = True
+        # Cells from this index on have not been painted into the layer yet
+        self._painted_count = 0
         
     def start_drag(self, cell: Tuple[int, int]) -> None:
         """Start bulldoze drag operation"""
         self.is_dragging = True
         self.drag_start_cell = cell
         self.drag_end_cell = cell
-        self.highlighted_cells = {cell}
+        self.highlighted_cells = {pack_cell(cell)}
+        self._xs = array('i', (cell[0],))
+        self._ys = array('i', (cell[1],))
+        self._last_added_cell = cell
+        self._bbox = (cell[0], cell[1], cell[0], cell[1])
+        self._row_bits = {cell[1]: 1}
+        self._bit_origin = cell[0]
+        self._overlay_stale = True
         
     def update_drag(self, cell: Tuple[int, int]) -> None:
         """Update drag operation with new end cell"""
@@ -32,8 +65,31 @@ class BulldozeManager:
             return
             
         self.drag_end_cell = cell
-        # Add this cell to highlighted cells (follow exact mouse path)
-        self.highlighted_cells.add(cell)
+        # Mouse is still inside the last cell: nothing new to add
+        if cell == self._last_added_cell:
+            return
+        # Add every cell between the previous and current mouse cell so fast drags leave no gaps
+        start = self._last_added_cell if self._last_added_cell is not None else cell
+        # Bound methods hoisted out of the per-cell loop
+        highlighted = self.highlighted_cells
+        highlighted_add = highlighted.add
+        xs_append = self._xs.append
+        ys_append = self._ys.append
+        set_bit = self._set_bit
+        for new_cell in self._iter_cells_between(start, cell):
+            key = pack_cell(new_cell)
+            if key in highlighted:
+                continue
+            highlighted_add(key)
+            xs_append(new_cell[0])
+            ys_append(new_cell[1])
+            set_bit(new_cell)
+        min_x, min_y, max_x, max_y = self._bbox if self._bbox is not None else (*cell, *cell)
+        self._bbox = (
+            min(min_x, start[0], cell[0]), min(min_y, start[1], cell[1]),
+            max(max_x, start[0], cell[0]), max(max_y, start[1], cell[1]),
+        )
+        self._last_added_cell = cell
         
     def end_drag(self) -> None:
         """End drag operation"""
@@ -42,41 +98,75 @@ class BulldozeManager:
     def clear_highlight(self) -> None:
         """Clear all highlighted cells"""
         self.highlighted_cells.clear()
+        self._xs = array('i')
+        self._ys = array('i')
+        self._row_bits.clear()
         self.drag_start_cell = None
         self.drag_end_cell = None
+        self._last_added_cell = None
+        self._bbox = None
+        self._overlay_stale = True
+        
+    def iter_cells(self) -> Iterator[Tuple[int, int]]:
+        """Iterate highlighted cells as (x, y) tuples"""
+        return zip(self._xs, self._ys)
+        
+    def _set_bit(self, cell: Tuple[int, int]) -> None:
+        """Mark a cell in the row bitmap, rebasing every row if it lies left of the origin"""
+        x, y = cell
+        if x < self._bit_origin:
+            shift = self._bit_origin - x
+            self._row_bits = {row: bits << shift for row, bits in self._row_bits.items()}
+            self._bit_origin = x
+        self._row_bits[y] = self._row_bits.get(y, 0) | (1 << (x - self._bit_origin))
+        
+    def _iter_cells_in_window(self, cx0: int, cy0: int, cx1: int, cy1: int) -> Iterator[Tuple[int, int]]:
+        """Iterate highlighted cells with cx0 <= x < cx1 and cy0 <= y < cy1 via the row bitmap"""
+        origin = self._bit_origin
+        lo = max(cx0 - origin, 0)
+        hi = cx1 - origin
+        if hi <= lo:
+            return
+        window_mask = (1 << (hi - lo)) - 1
+        row_bits = self._row_bits
+        for y in range(cy0, cy1):
+            bits = (row_bits.get(y, 0) >> lo) & window_mask
+            while bits:
+                low_bit = bits & -bits
+                yield (origin + lo + low_bit.bit_length() - 1, y)
+                bits ^= low_bit
         
-    def _get_cells_between(self, start: Tuple[int, int], end: Tuple[int, int]) -> Set[Tuple[int, int]]:
-        """Get all cells between start and end points using Bresenham's line algorithm"""
-        cells = set()
+    def _iter_cells_between(self, start: Tuple[int, int], end: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
+        """Yield all cells between start and end points using Bresenham's line algorithm"""
         x0, y0 = start
         x1, y1 = end
         
         dx = abs(x1 - x0)
         dy = abs(y1 - y0)
-        x, y = x0, y0
-        n = 1 + dx + dy
-        x_inc = 1 if x1 > x0 else -1
-        y_inc = 1 if y1 > y0 else -1
-        error = dx - dy
-        
-        dx *= 2
-        dy *= 2
-        
-        for _ in range(n):
-            cells.add((x, y))
-            if x == x1 and y == y1:
+        sx = 1 if x1 > x0 else -1
+        sy = 1 if y1 > y0 else -1
+        err = dx - dy
+        
+        # 8-connected walk: emits max(dx, dy) + 1 cells
+        while True:
+            yield (x0, y0)
+            if x0 == x1 and y0 == y1:
                 break
-            if error > 0:
-                x += x_inc
-                error -= dy
-            else:
-                y += y_inc
-                error += dx
+            e2 = err << 1
+            if e2 > -dy:
+                err -= dy
+                x0 += sx
+            if e2 < dx:
+                err += dx
+                y0 += sy
                 
-        return cells
-        
     def get_confirm_button_rect(self, screen_width: int, screen_height: int) -> pygame.Rect:
         """Get the confirm button rectangle positioned above the bulldoze button"""
+        # Layout only depends on screen size, so reuse the rect while it is unchanged
+        cache = self._confirm_cache
+        if cache is not None and cache[0] == screen_width and cache[1] == screen_height:
+            self.confirm_rect = cache[2]
+            return self.confirm_rect
         button_w = 150
         button_h = 40
         margin = 12
@@ -84,29 +174,102 @@ class BulldozeManager:
         x = screen_width - margin - button_w
         y = screen_height - button_h - margin - 50  # 50 pixels above bulldoze button
         self.confirm_rect = pygame.Rect(x, y, button_w, button_h)
+        self._confirm_cache = (screen_width, screen_height, self.confirm_rect)
         return self.confirm_rect
         
+    def _paint_cells(self, overlay: pygame.Surface, border_layer: pygame.Surface, cells: Iterable[Tuple[int, int]],
+                     camera_x: int, camera_y: int, grid_size: int) -> None:
+        """Paint the given cells into the highlight layers, stroking only the region outline"""
+        layer_rect = overlay.get_rect()
+        highlighted = self.highlighted_cells
+        color = BULLDOZE_HIGHLIGHT[:3]
+        # One rect reused for every cell instead of allocating per cell
+        rect = pygame.Rect(0, 0, grid_size, grid_size)
+        
+        # Tint the cells and collect them plus highlighted neighbours, whose outline may have changed
+        outline_cells = set()
+        for cell in cells:
+            rect.x = cell[0] * grid_size - camera_x
+            rect.y = cell[1] * grid_size - camera_y
+            # Surface.fill mis-clips rects with negative origins, so clip explicitly
+            overlay.fill(color, rect.clip(layer_rect))
+            outline_cells.add(cell)
+            x, y = cell
+            for nb in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+                if pack_cell(nb) in highlighted:
+                    outline_cells.add(nb)
+        
+        # Draw 2px edges only on sides that do not border another highlighted cell
+        edge = 2
+        for x, y in outline_cells:
+            px = x * grid_size - camera_x
+            py = y * grid_size - camera_y
+            rect.update(px, py, grid_size, grid_size)
+            border_layer.fill(LAYER_COLORKEY, rect.clip(layer_rect))
+            if pack_cell((x - 1, y)) not in highlighted:
+                rect.update(px, py, edge, grid_size)
+                border_layer.fill(BULLDOZE_BORDER, rect.clip(layer_rect))
+            if pack_cell((x + 1, y)) not in highlighted:
+                rect.update(px + grid_size - edge, py, edge, grid_size)
+                border_layer.fill(BULLDOZE_BORDER, rect.clip(layer_rect))
+            if pack_cell((x, y - 1)) not in highlighted:
+                rect.update(px, py, grid_size, edge)
+                border_layer.fill(BULLDOZE_BORDER, rect.clip(layer_rect))
+            if pack_cell((x, y + 1)) not in highlighted:
+                rect.update(px, py + grid_size - edge, grid_size, edge)
+                border_layer.fill(BULLDOZE_BORDER, rect.clip(layer_rect))
+        
     def draw_highlight(self, screen: pygame.Surface, camera_x: int, camera_y: int, grid_size: int) -> None:
         """Draw red highlighting for cells to be bulldozed"""
-        if not self.highlighted_cells:
+        if not self.highlighted_cells or self._bbox is None:
             return
             
-        for cell in self.highlighted_cells:
-            # Convert cell to screen coordinates
-            rect = pygame.Rect(
-                cell[0] * grid_size - camera_x,
-                cell[1] * grid_size - camera_y,
-                grid_size,
-                grid_size
-            )
+        screen_w, screen_h = screen.get_size()
+        # Visible cell window; cells outside it are skipped
+        cx0 = camera_x // grid_size
+        cy0 = camera_y // grid_size
+        cx1 = cx0 + screen_w // grid_size + 2
+        cy1 = cy0 + screen_h // grid_size + 2
+        
+        # Whole drag region is off-screen: nothing to draw
+        min_x, min_y, max_x, max_y = self._bbox
+        if max_x < cx0 or min_x >= cx1 or max_y < cy0 or min_y >= cy1:
+            return
             
-            # Draw semi-transparent red highlight
-            highlight_surface = pygame.Surface((grid_size, grid_size), pygame.SRCALPHA)
-            highlight_surface.fill(BULLDOZE_HIGHLIGHT)
-            screen.blit(highlight_surface, rect)
+        view = (camera_x, camera_y, screen_w, screen_h, grid_size)
+        overlay = self._overlay
+        border_layer = self._border_layer
+        if overlay is None or border_layer is None or overlay.get_size() != (screen_w, screen_h):
+            overlay = pygame.Surface((screen_w, screen_h)).convert()
+            overlay.set_colorkey(LAYER_COLORKEY)
+            overlay.set_alpha(BULLDOZE_HIGHLIGHT[3])
+            border_layer = pygame.Surface((screen_w, screen_h)).convert()
+            border_layer.set_colorkey(LAYER_COLORKEY)
+            self._overlay = overlay
+            self._border_layer = border_layer
+            self._overlay_stale = True
             
-            # Draw red border
-            pygame.draw.rect(screen, (255, 100, 100), rect, 2)
+        if self._overlay_stale or self._overlay_view != view:
+            # Camera, viewport or drag changed: re-rasterize the visible window
+            overlay.fill(LAYER_COLORKEY)
+            border_layer.fill(LAYER_COLORKEY)
+            self._paint_cells(
+                overlay, border_layer, self._iter_cells_in_window(cx0, cy0, cx1, cy1),
+                camera_x, camera_y, grid_size
+            )
+            self._overlay_view = view
+            self._overlay_stale = False
+        elif self._painted_count < len(self._xs):
+            start = self._painted_count
+            pending = zip(self._xs[start:], self._ys[start:])
+            self._paint_cells(
+                overlay, border_layer, (c for c in pending if cx0 <= c[0] < cx1 and cy0 <= c[1] < cy1),
+                camera_x, camera_y, grid_size
+            )
+        self._painted_count = len(self._xs)
+        
+        screen.blit(overlay, (0, 0))
+        screen.blit(border_layer, (0, 0))
             
     def draw_confirm_button(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
         """Draw the confirm button above the bulldoze button"""
@@ -122,7 +285,10 @@ class BulldozeManager:
         pygame.draw.rect(screen, BULLDOZE_CONFIRM_BORDER, self.confirm_rect, 2, border_radius=6)
         
         # Draw button text
-        label = font.render("CONFIRM", True, (255, 255, 255))
+        if self._confirm_label is None or self._confirm_font_id != id(font):
+            self._confirm_label = font.render("CONFIRM", True, (255, 255, 255))
+            self._confirm_font_id = id(font)
+        label = self._confirm_label
         label_rect = label.get_rect(center=self.confirm_rect.center)
         screen.blit(label, label_rect)
         
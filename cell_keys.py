@@ -0,0 +1,19 @@
+"""
+Packed integer keys for grid cells.
+Stores an (x, y) cell as a single int so sets hash one int instead of a tuple.
+"""
+
+from typing import Tuple
+
+_LOW_MASK = 0xFFFFFFFF
+_SIGN_BIT = 0x80000000
+
+
+def pack_cell(cell: Tuple[int, int]) -> int:
+    """Pack a signed (x, y) cell into a single int key"""
+    return (cell[1] << 32) | (cell[0] & _LOW_MASK)
+
+
+def unpack_cell(key: int) -> Tuple[int, int]:
+    """Unpack an int key back into a signed (x, y) cell"""
+    return (((key & _LOW_MASK) ^ _SIGN_BIT) - _SIGN_BIT, key >> 32)
@@ -0,0 +1,76 @@
+"""
+Cached rendering layers for static grid content (roads, trees, stones).
+The world is split into square chunks that are rendered once to a surface
+and only re-rendered when a cell inside them changes.
+"""
+
+import pygame
+from typing import Callable, Dict, Set, Tuple
+
+Coord = Tuple[int, int]
+
+
+class CellLayer:
+    def __init__(self, grid_size: int, draw_cell: Callable[[pygame.Surface, pygame.Rect], None],
+                 chunk_cells: int = 16):
+        """draw_cell paints one cell into a chunk surface at the given local rect"""
+        self.grid_size = grid_size
+        self.draw_cell = draw_cell
+        self.chunk_cells = chunk_cells
+        self.cells_by_chunk: Dict[Coord, Set[Coord]] = {}
+        self.chunk_surfaces: Dict[Coord, pygame.Surface] = {}
+        self.dirty_chunks: Set[Coord] = set()
+
+    def _chunk_of(self, cell: Coord) -> Coord:
+        return (cell[0] // self.chunk_cells, cell[1] // self.chunk_cells)
+
+    def add(self, cell: Coord) -> None:
+        """Add a cell and mark its chunk for re-rendering"""
+        chunk = self._chunk_of(cell)
+        self.cells_by_chunk.setdefault(chunk, set()).add(cell)
+        self.dirty_chunks.add(chunk)
+
+    def remove(self, cell: Coord) -> None:
+        """Remove a cell and mark its chunk for re-rendering"""
+        chunk = self._chunk_of(cell)
+        cells = self.cells_by_chunk.get(chunk)
+        if cells is None or cell not in cells:
+            return
+        cells.discard(cell)
+        if not cells:
+            del self.cells_by_chunk[chunk]
+            self.chunk_surfaces.pop(chunk, None)
+            self.dirty_chunks.discard(chunk)
+        else:
+            self.dirty_chunks.add(chunk)
+
+    def _render_chunk(self, chunk: Coord) -> pygame.Surface:
+        size = self.chunk_cells * self.grid_size
+        surface = self.chunk_surfaces.get(chunk)
+        if surface is None:
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            self.chunk_surfaces[chunk] = surface
+        surface.fill((0, 0, 0, 0))
+        origin_x = chunk[0] * self.chunk_cells
+        origin_y = chunk[1] * self.chunk_cells
+        gs = self.grid_size
+        for cx, cy in self.cells_by_chunk[chunk]:
+            rect = pygame.Rect((cx - origin_x) * gs, (cy - origin_y) * gs, gs, gs)
+            self.draw_cell(surface, rect)
+        return surface
+
+    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int) -> None:
+        """Blit every chunk that overlaps the viewport, rendering dirty ones first"""
+        chunk_px = self.chunk_cells * self.grid_size
+        screen_w, screen_h = screen.get_size()
+        for chx in range(camera_x // chunk_px, (camera_x + screen_w) // chunk_px + 1):
+            for chy in range(camera_y // chunk_px, (camera_y + screen_h) // chunk_px + 1):
+                chunk = (chx, chy)
+                if chunk not in self.cells_by_chunk:
+                    continue
+                if chunk in self.dirty_chunks or chunk not in self.chunk_surfaces:
+                    surface = self._render_chunk(chunk)
+                    self.dirty_chunks.discard(chunk)
+                else:
+                    surface = self.chunk_surfaces[chunk]
+                screen.blit(surface, (chx * chunk_px - camera_x, chy * chunk_px - camera_y))
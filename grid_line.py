@@ -0,0 +1,32 @@
+"""
+Grid line rasterisation for the logistics game.
+Walks the cells between two grid points so drags never leave gaps.
+"""
+
+from typing import Iterator, Tuple
+
+Coord = Tuple[int, int]
+
+
+def line_cells(start: Coord, end: Coord) -> Iterator[Coord]:
+    """Yield the cells from start to end (inclusive) using Bresenham's line algorithm"""
+    x, y = start
+    x1, y1 = end
+
+    dx = abs(x1 - x)
+    dy = -abs(y1 - y)
+    sx = 1 if x < x1 else -1
+    sy = 1 if y < y1 else -1
+    err = dx + dy
+
+    while True:
+        yield (x, y)
+        if x == x1 and y == y1:
+            return
+        e2 = err << 1
+        if e2 >= dy:
+            err += dy
+            x += sx
+        if e2 <= dx:
+            err += dx
+            y += sy
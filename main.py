@@ -1,14 +1,27 @@
+import logging
+import logging.handlers
 import math
 import random
 import sys
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Dict, Set, Tuple, Optional, List
+from typing import Dict, Iterator, Set, Tuple, Optional, List
 
 import pygame
 from bulldoze import BulldozeManager
 from truck_sprite import TruckSprite
 from truck_factory import TruckFactory
 from truck_selector import TruckSelector
+from spatial_hash import SpatialHash
+from cell_layer import CellLayer
+from grid_line import line_cells
+from union_find import UnionFind
+from nearest_road import NearestRoadField
+from road_path import bfs_path
+from text_cache import cached_sys_font
+from truck_motion import ARRIVAL_EPSILON, segment_towards
+
+log = logging.getLogger(__name__)
 
 
 WINDOW_WIDTH = 1024
@@ -16,6 +29,12 @@ WINDOW_HEIGHT = 768
 FPS = 60
 
 GRID_SIZE = 32
+# Maximum number of road routes kept between road edits
+PATH_CACHE_SIZE = 4096
+# How far (Manhattan, in cells) buildings and trucks look for a road
+NEAREST_ROAD_RADIUS = 12
+# Game messages are written to the console in batches of this many lines
+LOG_BUFFER_LINES = 32
 BG_COLOR = (28, 28, 35)
 GRID_COLOR = (60, 60, 70)
 GRID_BOLD_COLOR = (85, 85, 100)
@@ -34,26 +53,53 @@ STONE_COLOR = (120, 120, 125)
 STONE_COLOR_DARK = (90, 90, 95)
 REFINERY_COLOR = (120, 140, 170)
 
+# Build toolbar button captions
+TOOL_LABELS = {
+    "road": "Road",
+    "lumber": "Lumber Camp",
+    "quarry": "Quarry",
+    "refinery": "Refinery",
+    "bulldoze": "Bulldoze",
+}
+
+# Resource each producing building type accumulates while connected to the base
+PRODUCED_RESOURCE = {
+    "lumber": "wood",
+    "quarry": "stone",
+}
+
+# Explore-mode banner text per assignment stage
+BANNER_TEXTS = {
+    "choose_truck": "Choose a truck at the base",
+    "choose_source": "Fetching where? Click a source (e.g., Lumber Camp)",
+    "choose_resource": "Choose resource to fetch",
+    "confirm": "Confirm assignment and toggle repeat if desired",
+}
+
 
 Coord = Tuple[int, int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoadCell:
     x: int
     y: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Building:
     type: str
     cell: Coord
     radius_cells: int
     production_rate_per_sec: float
     storage: Dict[str, float]
+    conversion_timer: float = 0.0  # Refinery progress towards the next bmat
+    # Road connection to the base, valid while Game.roads_version equals _conn_version
+    _conn_version: int = -1
+    _conn_cached: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Truck:
     truck_id: int
     position_px: Tuple[float, float]
@@ -70,10 +116,31 @@ class Truck:
     saved_resource: Optional[str] = None
     marker_color: Tuple[int, int, int] = (255, 235, 120)
     path_color: Tuple[int, int, int] = (120, 200, 230)
-    current_direction: Tuple[float, float] = (1, 0)  # Default facing right
-
-
-@dataclass
+    current_direction: Tuple[float, float] = (1.0, 0.0)  # Default facing right
+    # Index of the next cell to drive to; path_cells is emptied once the last one is reached
+    path_index: int = 0
+    # Pixel center of path_cells[path_index], refreshed whenever the next cell changes
+    target_cell: Optional[Coord] = None
+    target_px: Tuple[float, float] = (0.0, 0.0)
+    # Unit direction towards target_px and the distance left, set when the target changes
+    step_dir: Tuple[float, float] = (0.0, 0.0)
+    remaining_px: float = 0.0
+    # Route bookkeeping for deliveries and the refinery stone/bmats loop
+    _dest_cell: Optional[Coord] = None
+    refinery_loop: bool = False
+    auto_stone_pickup: bool = False
+    stone_delivered: float = 0.0
+    waiting_timer: float = 0.0
+    waiting_target: float = 5.0
+    debug_timer: float = 0.0
+
+    def set_path(self, cells: List[Coord]) -> None:
+        """Start driving a new route from its first cell"""
+        self.path_cells = cells
+        self.path_index = 0
+
+
+@dataclass(slots=True)
 class Assignment:
     active: bool = False
     source_cell: Optional[Coord] = None
@@ -88,16 +155,61 @@ class Game:
         pygame.display.set_caption("Logistics Game - Prototype")
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.SysFont("consolas", 18)
+        self.font = cached_sys_font("consolas", 18)
+        # Static explore panel button labels
+        self._cancel_label = self.font.render("Cancel", True, UI_TEXT)
+        self._confirm_label = self.font.render("Confirm", True, UI_TEXT)
+        self._repeat_label = self.font.render("Repeat", True, UI_TEXT)
 
         # World state
         self.build_mode: bool = False
         self.grid_visible: bool = False
         self.roads: Set[Coord] = set()
-        # Binary road grid: 1 = driveable road, 0 = not driveable
-        self.road_grid: Dict[Coord, int] = {}
+        # Road grid as the set of driveable cells (roads, base and facilities)
+        self.road_grid: Set[Coord] = set()
+        # Derived from road_grid; extended by road_cell_added() and dropped by invalidate_road_caches()
+        self._road_dsu: Optional[UnionFind] = None
+        # Bumped on every road_grid change so per-building results can be revalidated cheaply
+        self.roads_version: int = 0
+        # Least recently used routes are evicted past PATH_CACHE_SIZE entries
+        self._path_cache: "OrderedDict[Tuple[Coord, Coord], List[Coord]]" = OrderedDict()
+        self._nearest_road_field: Optional[NearestRoadField] = None
+        # Nearest road to the base, valid while roads_version equals _base_road_version
+        self._base_road: Optional[Coord] = None
+        self._base_road_version: int = -1
         self.trees: Set[Coord] = set()
         self.stones: Set[Coord] = set()
+        # Union of roads, trees and stones so build checks need a single lookup
+        self.blocked_cells: Set[Coord] = set()
+        # Bucketed copies of trees/stones for fast radius queries
+        self.tree_hash = SpatialHash(bucket_size=8)
+        self.stone_hash = SpatialHash(bucket_size=8)
+        # Cached chunk surfaces for static world content
+        self.road_layer = CellLayer(GRID_SIZE, self._draw_road_cell)
+        self.tree_layer = CellLayer(GRID_SIZE, self._draw_tree_cell)
+        self.stone_layer = CellLayer(GRID_SIZE, self._draw_stone_cell)
+        self._grid_surface: Optional[pygame.Surface] = None
+        # UI layout caches; the rects handed out are shared and must not be mutated
+        self._bar_rects_cache: Optional[Dict[str, pygame.Rect]] = None
+        self._full_bar_rect: Optional[pygame.Rect] = None
+        self._truck_panel_cache: Optional[Tuple[Tuple[int, ...], Dict[str, pygame.Rect]]] = None
+        self._resource_panel_cache: Optional[Tuple[Tuple[str, ...], Dict[str, pygame.Rect]]] = None
+        self._confirm_panel_cache: Optional[Dict[str, pygame.Rect]] = None
+        # Pre-rendered build toolbar, keyed on the tool it shows as selected
+        self._toolbar_layer: Optional[Tuple[str, pygame.Surface]] = None
+        # Selected / unselected look of each toolbar button, keyed on (tool, selected)
+        self._button_surfaces: Dict[Tuple[str, bool], pygame.Surface] = {}
+        # Building info panel backgrounds with their titles, keyed on (title, size)
+        self._info_panel_backgrounds: Dict[Tuple[str, Tuple[int, int]], pygame.Surface] = {}
+        # (resources + mode, resources row, controls row, resources background) for draw_ui
+        self._status_text_cache: Optional[Tuple[tuple, pygame.Surface, pygame.Surface, pygame.Rect]] = None
+        # Rounded UI boxes by (size, fill, border, radius)
+        self._rounded_boxes: Dict[tuple, pygame.Surface] = {}
+        # Truck position marker ring per marker color
+        self._marker_surfaces: Dict[Tuple[int, int, int], pygame.Surface] = {}
+        # Production radius previews (5 cells) never change, so draw them once
+        self._lumber_overlay = self._build_radius_overlay(5 * GRID_SIZE, (60, 170, 90, 50), (60, 200, 110, 120))
+        self._quarry_overlay = self._build_radius_overlay(5 * GRID_SIZE, (150, 160, 185, 50), (170, 180, 200, 120))
         self.resources: Dict[str, int] = {
             "oil": 0,
             "steel": 0,
@@ -107,10 +219,22 @@ class Game:
         }
         self.resource_fractional_buffer: Dict[str, float] = {"wood": 0.0}
         self.buildings: List[Building] = []
+        # Index of buildings by their cell for constant-time lookups
+        self.buildings_by_cell: Dict[Coord, Building] = {}
+        # Slot of each building in self.buildings, for swap-and-pop removal
+        self._building_idx: Dict[Coord, int] = {}
+        # Bumped on every add/remove so hover lookups know when to refresh
+        self._buildings_version = 0
+        # Buildings that produce and are connected to the base, keyed on (buildings, roads) versions
+        self._active_producers: List[Building] = []
+        self._active_producers_key: Optional[Tuple[int, int]] = None
+        self._hover_key: Optional[tuple] = None
+        self._hover_building: Optional[Building] = None
         self.current_tool: str = "road"  # 'road' | 'lumber' | 'quarry' | 'refinery'
 
         # Trucks and assignments
         self.trucks: List[Truck] = []
+        self.trucks_by_id: Dict[int, Truck] = {}
         self.next_truck_id: int = 1
         self.pending_source: Optional[Coord] = None
         self.pending_truck_id: Optional[int] = None
@@ -140,6 +264,14 @@ class Game:
             random.randint(2, max(2, max_cells_x - 3)),
             random.randint(2, max(2, max_cells_y - 3)),
         )
+        # The base never moves, so its footprint and the no-build ring around it are fixed
+        bx, by = self.base_cell
+        self._base_area_cells = frozenset((bx + dx, by + dy) for dx in range(2) for dy in range(2))
+        self._base_adjacent_cells = frozenset((bx + dx, by + dy) for dx in range(-1, 3) for dy in range(-1, 3))
+        # Pixel box (left, right, top, bottom) within one cell of the base center
+        center_x = bx * GRID_SIZE + GRID_SIZE // 2
+        center_y = by * GRID_SIZE + GRID_SIZE // 2
+        self._base_near_px = (center_x - GRID_SIZE, center_x + GRID_SIZE, center_y - GRID_SIZE, center_y + GRID_SIZE)
 
         # Scatter trees and stones around the starting area (avoid base cell)
         self._generate_resources_around_view(max_cells_x, max_cells_y)
@@ -160,7 +292,7 @@ class Game:
         bx, by = self.base_cell
         for dx in range(2):
             for dy in range(2):
-                self.road_grid[(bx + dx, by + dy)] = 1
+                self.road_grid.add((bx + dx, by + dy))
         
         # Starting trucks at base
         self.spawn_starting_truck()
@@ -196,42 +328,63 @@ class Game:
             cargo_capacity=20.0,
             marker_color=mc,
             path_color=pc,
-            current_direction=(1, 0),  # Default facing right
+            current_direction=(1.0, 0.0),  # Default facing right
         )
         self.next_truck_id += 1
         self.trucks.append(truck)
+        self.trucks_by_id[truck.truck_id] = truck
 
     def _generate_resources_around_view(self, view_cells_x: int, view_cells_y: int) -> None:
         area_min_x = -view_cells_x
         area_max_x = view_cells_x * 2
         area_min_y = -view_cells_y
         area_max_y = view_cells_y * 2
+        candidates = self._iter_random_cells(area_min_x, area_max_x, area_min_y, area_max_y)
+        base_area = self._base_area_cells
         # Half the previous density
         num_trees = max(75, (view_cells_x * view_cells_y) // 4)
         attempts = 0
         while len(self.trees) < num_trees and attempts < num_trees * 10:
             attempts += 1
-            cx = random.randint(area_min_x, area_max_x)
-            cy = random.randint(area_min_y, area_max_y)
-            cell = (cx, cy)
-            if self.is_cell_in_base_area(cell):
+            cell = next(candidates)
+            if cell in base_area:
                 continue
-            self.trees.add(cell)
+            if cell not in self.trees:
+                self.trees.add(cell)
+                self.tree_hash.insert(cell)
+                self.tree_layer.add(cell)
+                self.blocked_cells.add(cell)
         # Stones: around 1/4 of the amount of trees
         target_stones = max(10, len(self.trees) // 4)
         attempts = 0
         while len(self.stones) < target_stones and attempts < target_stones * 20:
             attempts += 1
-            cx = random.randint(area_min_x, area_max_x)
-            cy = random.randint(area_min_y, area_max_y)
-            cell = (cx, cy)
-            if self.is_cell_in_base_area(cell) or cell in self.trees:
+            cell = next(candidates)
+            if cell in base_area or cell in self.trees:
                 continue
-            self.stones.add(cell)
+            if cell not in self.stones:
+                self.stones.add(cell)
+                self.stone_hash.insert(cell)
+                self.stone_layer.add(cell)
+                self.blocked_cells.add(cell)
+
+    def _iter_random_cells(self, min_x: int, max_x: int, min_y: int, max_y: int,
+                           batch: int = 1024) -> Iterator[Coord]:
+        # Draw candidate coordinates in batches rather than two randint calls per attempt
+        xs = range(min_x, max_x + 1)
+        ys = range(min_y, max_y + 1)
+        while True:
+            yield from zip(random.choices(xs, k=batch), random.choices(ys, k=batch))
 
     # -------- Input --------
     def handle_events(self) -> None:
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        last_index = len(events) - 1
+        for i, event in enumerate(events):
+            # Motion handlers read the live cursor position, so only the last
+            # of a run of consecutive motion events has any effect
+            if event.type == pygame.MOUSEMOTION and i < last_index and events[i + 1].type == pygame.MOUSEMOTION:
+                continue
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit(0)
@@ -245,13 +398,13 @@ class Game:
                     if self.assign_stage == "choose_truck":
                         # Menu is already open, close it
                         self.clear_pending_selection()
-                        print("Closed truck menu")
+                        log.info("Closed truck menu")
                     else:
                         # Menu is not open, open it and go to base
                         self.center_camera_on_base()
                         self.pending_destination = self.base_cell
                         self.assign_stage = "choose_truck"
-                        print("Opened truck menu")
+                        log.info("Opened truck menu")
                 if event.key == pygame.K_b:
                     self.build_mode = not self.build_mode
                     self.grid_visible = self.build_mode
@@ -264,17 +417,17 @@ class Game:
                         # If same truck is already selected, deselect it
                         if self.truck_selector.selected_truck_id == truck_number:
                             self.truck_selector.selected_truck_id = None
-                            print(f"Deselected Truck {truck_number}")
+                            log.info("Deselected Truck %s", truck_number)
                         else:
                             # Select the new truck
                             self.truck_selector.selected_truck_id = truck_number
-                            print(f"Selected Truck {truck_number}")
+                            log.info("Selected Truck %s", truck_number)
                             # Center camera on the selected truck
                             selected_truck = self.get_truck_by_id(truck_number)
                             if selected_truck:
                                 self.center_camera_on_cell(selected_truck.current_cell)
                     else:
-                        print(f"No truck {truck_number} available")
+                        log.info("No truck %s available", truck_number)
 
             if self.build_mode:
                 # UI bar interactions take priority
@@ -340,7 +493,7 @@ class Game:
                         selected_truck = self.get_truck_by_id(self.truck_selector.selected_truck_id)
                         if selected_truck:
                             self.truck_selector.reset_truck(selected_truck)
-                            print(f"Reset Truck {self.truck_selector.selected_truck_id}")
+                            log.info("Reset Truck %s", self.truck_selector.selected_truck_id)
                     else:
                         clicked_cell = self.world_to_cell(pygame.mouse.get_pos())
                         if self.assign_stage == "idle":
@@ -352,13 +505,13 @@ class Game:
                             else:
                                 b = self.get_building_at_cell(clicked_cell)
                                 if b is not None:
-                                    print(f"Clicked on building: {b.type} at {clicked_cell}")
+                                    log.info("Clicked on building: %s at %s", b.type, clicked_cell)
                                     if b.type in ("lumber", "quarry"):
                                         # Lumber and quarry are sources - they produce resources
                                         self.pending_source = clicked_cell
                                         self.pending_destination = self.base_cell
                                         self.assign_stage = "choose_truck"
-                                        print(f"Starting truck assignment for {b.type} (source)")
+                                        log.info("Starting truck assignment for %s (source)", b.type)
                                         return
                                     elif b.type == "refinery":
                                         # Refinery is a destination - it needs stone delivered
@@ -366,7 +519,7 @@ class Game:
                                         self.pending_source = self.base_cell  # Base has stone
                                         self.pending_destination = clicked_cell  # Refinery needs stone
                                         self.assign_stage = "choose_truck"
-                                        print(f"Refinery selected: Base → Refinery route (stone delivery)")
+                                        log.info("Refinery selected: Base → Refinery route (stone delivery)")
                                         return
                         elif self.assign_stage == "choose_source":
                             # Select source facility
@@ -396,8 +549,9 @@ class Game:
             if self.last_painted_cell is None or current_cell != self.last_painted_cell:
                 # Paint along the line between last and current to avoid gaps while dragging fast
                 if self.last_painted_cell is not None:
-                    for cell in self.cells_on_line(self.last_painted_cell, current_cell):
-                        self.paint_cell(cell)
+                    paint_cell = self.paint_cell
+                    for cell in line_cells(self.last_painted_cell, current_cell):
+                        paint_cell(cell)
                 else:
                     self.paint_cell(current_cell)
                 self.last_painted_cell = current_cell
@@ -420,25 +574,31 @@ class Game:
             GRID_SIZE,
         )
 
+    def visible_cell_bounds(self) -> Tuple[int, int, int, int]:
+        # Inclusive cell range covered by the viewport, padded by one cell
+        min_cx = self.camera_x // GRID_SIZE - 1
+        min_cy = self.camera_y // GRID_SIZE - 1
+        max_cx = (self.camera_x + WINDOW_WIDTH) // GRID_SIZE + 1
+        max_cy = (self.camera_y + WINDOW_HEIGHT) // GRID_SIZE + 1
+        return min_cx, min_cy, max_cx, max_cy
+
     def paint_cell(self, cell: Coord) -> None:
         # Do not build on trees or existing roads
-        if cell in self.trees or cell in self.stones or cell in self.roads:
+        if cell in self.blocked_cells:
             return
         # Require BMATs to build
         if self.resources.get("bmats", 0) <= 0:
             return
         self.roads.add(cell)
-        self.road_grid[cell] = 1  # Mark as driveable road
+        self.road_layer.add(cell)
+        self.blocked_cells.add(cell)
+        self.road_grid.add(cell)  # Mark as driveable road
+        self.road_cell_added(cell)
         self.resources["bmats"] -= 1
 
     def can_place_lumber(self, cell: Coord) -> bool:
-        if cell in self.trees or cell in self.stones:
+        if cell in self.blocked_cells or cell in self.buildings_by_cell:
             return False
-        if cell in self.roads:
-            return False
-        for b in self.buildings:
-            if b.cell == cell:
-                return False
         # Don't allow building directly adjacent to base (including diagonals)
         if self.is_cell_adjacent_to_base(cell):
             return False
@@ -451,20 +611,15 @@ class Game:
         tree_count = self.count_trees_in_radius(cell, radius_cells)
         # Production scales with trees in radius (0.2 wood/sec per tree)
         production_rate = tree_count * 0.2
-        self.buildings.append(
-            Building(type="lumber", cell=cell, radius_cells=radius_cells, production_rate_per_sec=production_rate, storage={"wood": 0.0})
-        )
+        building = Building(type="lumber", cell=cell, radius_cells=radius_cells, production_rate_per_sec=production_rate, storage={"wood": 0.0})
+        self.add_building(building)
         # Mark facility cell as driveable so trucks can enter
-        self.road_grid[cell] = 1
+        self.road_grid.add(cell)
+        self.road_cell_added(cell)
 
     def can_place_quarry(self, cell: Coord) -> bool:
-        if cell in self.trees or cell in self.stones:
-            return False
-        if cell in self.roads:
+        if cell in self.blocked_cells or cell in self.buildings_by_cell:
             return False
-        for b in self.buildings:
-            if b.cell == cell:
-                return False
         # Don't allow building directly adjacent to base (including diagonals)
         if self.is_cell_adjacent_to_base(cell):
             return False
@@ -476,20 +631,15 @@ class Game:
         radius_cells = 5
         stone_count = self.count_stones_in_radius(cell, radius_cells)
         production_rate = stone_count * 0.2
-        self.buildings.append(
-            Building(type="quarry", cell=cell, radius_cells=radius_cells, production_rate_per_sec=production_rate, storage={"stone": 0.0})
-        )
+        building = Building(type="quarry", cell=cell, radius_cells=radius_cells, production_rate_per_sec=production_rate, storage={"stone": 0.0})
+        self.add_building(building)
         # Mark facility cell as driveable so trucks can enter
-        self.road_grid[cell] = 1
+        self.road_grid.add(cell)
+        self.road_cell_added(cell)
 
     def can_place_refinery(self, cell: Coord) -> bool:
-        if cell in self.trees or cell in self.stones:
+        if cell in self.blocked_cells or cell in self.buildings_by_cell:
             return False
-        if cell in self.roads:
-            return False
-        for b in self.buildings:
-            if b.cell == cell:
-                return False
         # Don't allow building directly adjacent to base (including diagonals)
         if self.is_cell_adjacent_to_base(cell):
             return False
@@ -499,28 +649,48 @@ class Game:
         if not self.can_place_refinery(cell):
             return
         # Refineries convert stone to bmats: 1 stone = 1 bmat every 5 seconds
-        self.buildings.append(
-            Building(type="refinery", cell=cell, radius_cells=0, production_rate_per_sec=0.2, storage={"stone": 0.0, "bmats": 0.0})
-        )
+        building = Building(type="refinery", cell=cell, radius_cells=0, production_rate_per_sec=0.2, storage={"stone": 0.0, "bmats": 0.0})
+        self.add_building(building)
         # Mark facility cell as driveable so trucks can enter
-        self.road_grid[cell] = 1
+        self.road_grid.add(cell)
+        self.road_cell_added(cell)
+
+    def add_building(self, building: Building) -> None:
+        self._buildings_version += 1
+        self._building_idx[building.cell] = len(self.buildings)
+        self.buildings.append(building)
+        self.buildings_by_cell[building.cell] = building
+
+    def remove_building_at(self, cell: Coord) -> Optional[Building]:
+        # Swap the last building into the freed slot so removal is O(1)
+        building = self.buildings_by_cell.pop(cell, None)
+        if building is None:
+            return None
+        self._buildings_version += 1
+        idx = self._building_idx.pop(cell)
+        last = self.buildings.pop()
+        if idx < len(self.buildings):
+            self.buildings[idx] = last
+            self._building_idx[last.cell] = idx
+        return building
 
     def execute_bulldoze(self) -> None:
         """Execute bulldoze operation on all highlighted cells"""
-        for cell in self.bulldoze_manager.highlighted_cells:
+        for cell in self.bulldoze_manager.iter_cells():
             if cell in self.roads:
                 self.roads.remove(cell)
-                self.road_grid[cell] = 0  # Mark as not driveable
+                self.road_layer.remove(cell)
+                self.blocked_cells.discard(cell)
+                self.road_grid.discard(cell)  # Mark as not driveable
+                self.invalidate_road_caches()
                 self.resources["bmats"] += 1  # Refund
             else:
                 # Check if there's a building here
-                for i, b in enumerate(list(self.buildings)):
-                    if b.cell == cell:
-                        # Remove from road grid if it was a facility
-                        if b.cell in self.road_grid:
-                            self.road_grid[b.cell] = 0
-                        del self.buildings[i]
-                        break
+                b = self.remove_building_at(cell)
+                if b is not None:
+                    # Remove from road grid if it was a facility
+                    self.road_grid.discard(b.cell)
+                    self.invalidate_road_caches()
         
         # Clear the highlight after execution
         self.bulldoze_manager.clear_highlight()
@@ -532,9 +702,9 @@ class Game:
             self.resources["bmats"] -= cost
             self.spawn_truck_at_base()
             self.truck_factory.build_truck()
-            print(f"Built new truck for {cost} BMATS! Total trucks: {len(self.trucks)}")
+            log.info("Built new truck for %s BMATS! Total trucks: %s", cost, len(self.trucks))
         else:
-            print(f"Not enough BMATS! Need {cost}, have {self.resources.get('bmats', 0)}")
+            log.info("Not enough BMATS! Need %s, have %s", cost, self.resources.get('bmats', 0))
 
     def bulldoze_at(self, cell: Coord) -> None:
         # Refund rules:
@@ -542,89 +712,62 @@ class Game:
         # - Building (lumber/refinery) → no cost yet, simply remove
         if cell in self.roads:
             self.roads.remove(cell)
+            self.road_layer.remove(cell)
+            self.blocked_cells.discard(cell)
             self.resources["bmats"] += 1
             return
-        for i, b in enumerate(list(self.buildings)):
-            if b.cell == cell:
-                # Simple refund logic placeholder; could refund some materials later
-                del self.buildings[i]
-                return
+        # Simple refund logic placeholder; could refund some materials later
+        self.remove_building_at(cell)
 
     def count_trees_in_radius(self, center_cell: Coord, radius_cells: int) -> int:
-        rc2 = radius_cells * radius_cells
-        cx, cy = center_cell
-        count = 0
-        for tx, ty in self.trees:
-            dx = tx - cx
-            dy = ty - cy
-            if dx * dx + dy * dy <= rc2:
-                count += 1
-        return count
+        return self.tree_hash.count_in_radius(center_cell, radius_cells)
 
     def count_stones_in_radius(self, center_cell: Coord, radius_cells: int) -> int:
-        rc2 = radius_cells * radius_cells
-        cx, cy = center_cell
-        count = 0
-        for sx, sy in self.stones:
-            dx = sx - cx
-            dy = sy - cy
-            if dx * dx + dy * dy <= rc2:
-                count += 1
-        return count
+        return self.stone_hash.count_in_radius(center_cell, radius_cells)
 
     def cells_on_line(self, start: Coord, end: Coord) -> Set[Coord]:
         # Bresenham's line algorithm over grid cells
-        x0, y0 = start
-        x1, y1 = end
-        cells: Set[Coord] = set()
-
-        dx = abs(x1 - x0)
-        dy = -abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx + dy
-
-        x, y = x0, y0
-        while True:
-            cells.add((x, y))
-            if x == x1 and y == y1:
-                break
-            e2 = 2 * err
-            if e2 >= dy:
-                err += dy
-                x += sx
-            if e2 <= dx:
-                err += dx
-                y += sy
-        return cells
+        return set(line_cells(start, end))
 
     # -------- Rendering --------
     def draw_grid(self) -> None:
         if not self.grid_visible:
             return
-        # Minor grid aligned to camera
-        start_x = -(self.camera_x % GRID_SIZE)
-        start_y = -(self.camera_y % GRID_SIZE)
-        for x in range(start_x, WINDOW_WIDTH, GRID_SIZE):
-            pygame.draw.line(self.screen, GRID_COLOR, (x, 0), (x, WINDOW_HEIGHT))
-        for y in range(start_y, WINDOW_HEIGHT, GRID_SIZE):
-            pygame.draw.line(self.screen, GRID_COLOR, (0, y), (WINDOW_WIDTH, y))
+        # The pattern repeats every 4 cells, so blit a cached sheet shifted by the camera.
+        # The sheet carries one extra period on each side so wide lines keep both halves.
+        period = GRID_SIZE * 4
+        if self._grid_surface is None:
+            self._grid_surface = self._build_grid_surface(period)
+        self.screen.blit(
+            self._grid_surface,
+            (-(self.camera_x % period) - period, -(self.camera_y % period) - period),
+        )
+
+    def _build_grid_surface(self, period: int) -> pygame.Surface:
+        width = WINDOW_WIDTH + period * 3
+        height = WINDOW_HEIGHT + period * 3
+        surface = pygame.Surface((width, height)).convert()
+        surface.fill((0, 0, 0))
+        surface.set_colorkey((0, 0, 0))
+        # Minor grid
+        for x in range(0, width, GRID_SIZE):
+            pygame.draw.line(surface, GRID_COLOR, (x, 0), (x, height))
+        for y in range(0, height, GRID_SIZE):
+            pygame.draw.line(surface, GRID_COLOR, (0, y), (width, y))
 
         # Bold lines every 4 cells (overlay)
-        for x in range(start_x, WINDOW_WIDTH, GRID_SIZE):
-            world_cell_x = (x + self.camera_x) // GRID_SIZE
-            if world_cell_x % 4 == 0:
-                pygame.draw.line(self.screen, GRID_BOLD_COLOR, (x, 0), (x, WINDOW_HEIGHT), 2)
-        for y in range(start_y, WINDOW_HEIGHT, GRID_SIZE):
-            world_cell_y = (y + self.camera_y) // GRID_SIZE
-            if world_cell_y % 4 == 0:
-                pygame.draw.line(self.screen, GRID_BOLD_COLOR, (0, y), (WINDOW_WIDTH, y), 2)
+        for x in range(0, width, period):
+            pygame.draw.line(surface, GRID_BOLD_COLOR, (x, 0), (x, height), 2)
+        for y in range(0, height, period):
+            pygame.draw.line(surface, GRID_BOLD_COLOR, (0, y), (width, y), 2)
+        return surface
 
     def draw_roads(self) -> None:
-        for cell in self.roads:
-            rect = self.cell_to_rect(cell)
-            pygame.draw.rect(self.screen, ROAD_COLOR, rect)
-            pygame.draw.rect(self.screen, ROAD_OUTLINE, rect, 1)
+        self.road_layer.draw(self.screen, self.camera_x, self.camera_y)
+
+    def _draw_road_cell(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        pygame.draw.rect(surface, ROAD_COLOR, rect)
+        pygame.draw.rect(surface, ROAD_OUTLINE, rect, 1)
 
     def draw_base(self) -> None:
         rect = self.cell_to_rect(self.base_cell)
@@ -640,26 +783,32 @@ class Game:
         # Base label and truck factory button removed - will be in truck selection panel instead
 
     def draw_trees(self) -> None:
-        for cell in self.trees:
-            rect = self.cell_to_rect(cell)
-            center = (rect.centerx, rect.centery)
-            radius = GRID_SIZE // 2 - 4
-            pygame.draw.circle(self.screen, TREE_COLOR, center, radius)
-            pygame.draw.circle(self.screen, TREE_DARK, center, radius, 2)
+        self.tree_layer.draw(self.screen, self.camera_x, self.camera_y)
+
+    def _draw_tree_cell(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        center = (rect.centerx, rect.centery)
+        radius = GRID_SIZE // 2 - 4
+        pygame.draw.circle(surface, TREE_COLOR, center, radius)
+        pygame.draw.circle(surface, TREE_DARK, center, radius, 2)
 
     def draw_stones(self) -> None:
-        for cell in self.stones:
-            rect = self.cell_to_rect(cell)
-            center = (rect.centerx, rect.centery)
-            # 50% bigger than trees but clamp to cell
-            radius = min(GRID_SIZE // 2 - 2, int((GRID_SIZE // 2 - 4) * 1.5))
-            # Not a perfect circle: draw two overlapping blobs
-            pygame.draw.circle(self.screen, STONE_COLOR, (center[0] - 2, center[1]), radius)
-            pygame.draw.circle(self.screen, STONE_COLOR, (center[0] + 3, center[1] - 1), int(radius * 0.9))
-            pygame.draw.circle(self.screen, STONE_COLOR_DARK, center, radius, 2)
+        self.stone_layer.draw(self.screen, self.camera_x, self.camera_y)
+
+    def _draw_stone_cell(self, surface: pygame.Surface, rect: pygame.Rect) -> None:
+        center = (rect.centerx, rect.centery)
+        # 50% bigger than trees but clamp to cell
+        radius = min(GRID_SIZE // 2 - 2, int((GRID_SIZE // 2 - 4) * 1.5))
+        # Not a perfect circle: draw two overlapping blobs
+        pygame.draw.circle(surface, STONE_COLOR, (center[0] - 2, center[1]), radius)
+        pygame.draw.circle(surface, STONE_COLOR, (center[0] + 3, center[1] - 1), int(radius * 0.9))
+        pygame.draw.circle(surface, STONE_COLOR_DARK, center, radius, 2)
 
     def draw_buildings(self) -> None:
+        min_cx, min_cy, max_cx, max_cy = self.visible_cell_bounds()
         for b in self.buildings:
+            bx, by = b.cell
+            if bx < min_cx or bx > max_cx or by < min_cy or by > max_cy:
+                continue
             if b.type == "lumber":
                 rect = self.cell_to_rect(b.cell)
                 pygame.draw.rect(self.screen, LUMBER_COLOR, rect, border_radius=4)
@@ -674,17 +823,29 @@ class Game:
                 # No text on building - only in popup UI
 
     def draw_trucks(self) -> None:
+        # Sprites are at most ~44px across, so a one-cell margin keeps partly visible trucks
+        left = self.camera_x - GRID_SIZE
+        right = self.camera_x + WINDOW_WIDTH + GRID_SIZE
+        top = self.camera_y - GRID_SIZE
+        bottom = self.camera_y + WINDOW_HEIGHT + GRID_SIZE
         for t in self.trucks:
             # Calculate direction for sprite rotation
             direction = t.current_direction
-            if t.path_cells:
+            # Already facing along the segment being driven (the usual case on straight
+            # runs): smoothing would return the same heading, so skip the call
+            if t.path_cells and not (direction == t.step_dir and t.target_cell == t.path_cells[t.path_index]):
                 # Use grid-aligned direction calculation for perfect 90-degree rotations
-                new_direction = self.truck_sprite.get_grid_aligned_direction(
-                    t.position_px, t.path_cells, t.current_direction
+                new_direction = self.truck_sprite.get_grid_aligned_direction_to_cell(
+                    t.position_px, t.path_cells[t.path_index], t.current_direction
                 )
                 t.current_direction = new_direction
                 direction = new_direction
             
+            # Heading is still smoothed above for off-screen trucks; only the blit is skipped
+            px, py = t.position_px
+            if not (left <= px <= right and top <= py <= bottom):
+                continue
+            
             # Draw the truck sprite
             self.truck_sprite.draw_truck(
                 self.screen, 
@@ -697,54 +858,64 @@ class Game:
             # Truck ID is now displayed by the truck selector system
 
     def draw_truck_paths(self) -> None:
-        node_radius = 4
+        # One polyline per truck through the remaining path cell centers
+        offset_x = GRID_SIZE // 2 - self.camera_x
+        offset_y = GRID_SIZE // 2 - self.camera_y
         for t in self.trucks:
-            for cell in t.path_cells:
-                cx = cell[0] * GRID_SIZE + GRID_SIZE // 2 - self.camera_x
-                cy = cell[1] * GRID_SIZE + GRID_SIZE // 2 - self.camera_y
-                pygame.draw.circle(self.screen, t.path_color, (int(cx), int(cy)), node_radius, 1)
+            if not t.path_cells:
+                continue
+            points = [(cx * GRID_SIZE + offset_x, cy * GRID_SIZE + offset_y) for cx, cy in t.path_cells[t.path_index:]]
+            if len(points) == 1:
+                pygame.draw.circle(self.screen, t.path_color, points[0], 4, 1)
+            else:
+                pygame.draw.lines(self.screen, t.path_color, False, points, 1)
 
     def draw_truck_markers(self) -> None:
-        # Moving marker at the truck's live position
+        # Moving marker at the truck's live position, blitted in one batch
+        markers: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        camera_x = self.camera_x
+        camera_y = self.camera_y
         for t in self.trucks:
-            mx = int(t.position_px[0] - self.camera_x)
-            my = int(t.position_px[1] - self.camera_y)
-            pygame.draw.circle(self.screen, t.marker_color, (mx, my), 6, 2)
+            # Round rather than truncate so markers don't jump a pixel when crossing 0
+            px, py = t.position_px
+            mx = round(px - camera_x)
+            my = round(py - camera_y)
+            # Skip rings that lie entirely off screen
+            if not (-6 <= mx < WINDOW_WIDTH + 6 and -6 <= my < WINDOW_HEIGHT + 6):
+                continue
+            marker = self._marker_surfaces.get(t.marker_color)
+            if marker is None:
+                marker = pygame.Surface((13, 13), pygame.SRCALPHA)
+                pygame.draw.circle(marker, t.marker_color, (6, 6), 6, 2)
+                self._marker_surfaces[t.marker_color] = marker
+            markers.append((marker, (mx - 6, my - 6)))
+        self.screen.blits(markers, doreturn=False)
+
+    def _build_radius_overlay(self, radius_px: int, fill: Tuple[int, int, int, int],
+                              outline: Tuple[int, int, int, int]) -> pygame.Surface:
+        overlay = pygame.Surface((radius_px * 2, radius_px * 2), pygame.SRCALPHA)
+        pygame.draw.circle(overlay, fill, (radius_px, radius_px), radius_px)
+        pygame.draw.circle(overlay, outline, (radius_px, radius_px), radius_px, 2)
+        return overlay
 
     def draw_lumber_preview(self) -> None:
         if not self.build_mode or self.current_tool != "lumber" or self.preview_cell is None:
             return
-        cx, cy = self.preview_cell
-        radius_cells = 5
-        radius_px = radius_cells * GRID_SIZE
-        center_px = (
-            cx * GRID_SIZE + GRID_SIZE // 2 - self.camera_x,
-            cy * GRID_SIZE + GRID_SIZE // 2 - self.camera_y,
-        )
-        overlay = pygame.Surface((radius_px * 2, radius_px * 2), pygame.SRCALPHA)
-        pygame.draw.circle(overlay, (60, 170, 90, 50), (radius_px, radius_px), radius_px)
-        pygame.draw.circle(overlay, (60, 200, 110, 120), (radius_px, radius_px), radius_px, 2)
-        self.screen.blit(overlay, (center_px[0] - radius_px, center_px[1] - radius_px))
-        # Draw preview building footprint
-        brect = self.cell_to_rect(self.preview_cell)
-        pygame.draw.rect(self.screen, LUMBER_COLOR, brect, 2, border_radius=4)
+        self._draw_radius_preview(self._lumber_overlay, LUMBER_COLOR)
 
     def draw_quarry_preview(self) -> None:
         if not self.build_mode or self.current_tool != "quarry" or self.preview_cell is None:
             return
+        self._draw_radius_preview(self._quarry_overlay, REFINERY_COLOR)
+
+    def _draw_radius_preview(self, overlay: pygame.Surface, footprint_color: Tuple[int, int, int]) -> None:
+        # The overlay is centered on the preview cell, so its top-left is one radius up/left of the center
         cx, cy = self.preview_cell
-        radius_cells = 5
-        radius_px = radius_cells * GRID_SIZE
-        center_px = (
-            cx * GRID_SIZE + GRID_SIZE // 2 - self.camera_x,
-            cy * GRID_SIZE + GRID_SIZE // 2 - self.camera_y,
-        )
-        overlay = pygame.Surface((radius_px * 2, radius_px * 2), pygame.SRCALPHA)
-        pygame.draw.circle(overlay, (150, 160, 185, 50), (radius_px, radius_px), radius_px)
-        pygame.draw.circle(overlay, (170, 180, 200, 120), (radius_px, radius_px), radius_px, 2)
-        self.screen.blit(overlay, (center_px[0] - radius_px, center_px[1] - radius_px))
+        half = GRID_SIZE // 2 - overlay.get_width() // 2
+        self.screen.blit(overlay, (cx * GRID_SIZE + half - self.camera_x, cy * GRID_SIZE + half - self.camera_y))
+        # Draw preview building footprint
         brect = self.cell_to_rect(self.preview_cell)
-        pygame.draw.rect(self.screen, REFINERY_COLOR, brect, 2, border_radius=4)
+        pygame.draw.rect(self.screen, footprint_color, brect, 2, border_radius=4)
 
     def draw_refinery_preview(self) -> None:
         if not self.build_mode or self.current_tool != "refinery" or self.preview_cell is None:
@@ -753,6 +924,14 @@ class Game:
         brect = self.cell_to_rect(self.preview_cell)
         pygame.draw.rect(self.screen, (180, 120, 80), brect, 2, border_radius=4)
 
+    def get_hovered_building(self, mouse_pos: Tuple[int, int]) -> Optional[Building]:
+        # Reuse the last hit test while the mouse, camera and buildings are unchanged
+        key = (mouse_pos, self.camera_x, self.camera_y, self._buildings_version)
+        if key != self._hover_key:
+            self._hover_key = key
+            self._hover_building = self.get_building_at_cell(self.world_to_cell(mouse_pos))
+        return self._hover_building
+
     def draw_building_info_panels(self) -> None:
         """Draw info panels for buildings when clicked"""
         if self.build_mode:
@@ -760,8 +939,7 @@ class Game:
             
         # Check if we're hovering over a building
         mouse_pos = pygame.mouse.get_pos()
-        hover_cell = self.world_to_cell(mouse_pos)
-        building = self.get_building_at_cell(hover_cell)
+        building = self.get_hovered_building(mouse_pos)
         
         if building:
             if building.type == "refinery":
@@ -774,6 +952,32 @@ class Game:
                 # Draw lumber camp info panel
                 self.draw_lumber_info_panel(building, mouse_pos)
 
+    def draw_rounded_box(self, rect: pygame.Rect, fill: Tuple[int, int, int],
+                         border: Optional[Tuple[int, int, int]], radius: int) -> None:
+        """Blit a filled rounded rect with an optional 2px border, rasterized once per size and colors"""
+        key = (rect.size, fill, border, radius)
+        box = self._rounded_boxes.get(key)
+        if box is None:
+            box = pygame.Surface(rect.size, pygame.SRCALPHA)
+            pygame.draw.rect(box, fill, box.get_rect(), border_radius=radius)
+            if border is not None:
+                pygame.draw.rect(box, border, box.get_rect(), 2, border_radius=radius)
+            self._rounded_boxes[key] = box
+        self.screen.blit(box, rect)
+
+    def get_info_panel_background(self, title: str, size: Tuple[int, int]) -> pygame.Surface:
+        key = (title, size)
+        background = self._info_panel_backgrounds.get(key)
+        if background is None:
+            background = pygame.Surface(size, pygame.SRCALPHA)
+            panel_rect = background.get_rect()
+            pygame.draw.rect(background, (45, 45, 52), panel_rect, border_radius=8)
+            pygame.draw.rect(background, (80, 80, 95), panel_rect, 2, border_radius=8)
+            title_surf = self.font.render(title, True, (255, 255, 255))
+            background.blit(title_surf, title_surf.get_rect(midtop=(panel_rect.centerx, panel_rect.y + 10)))
+            self._info_panel_backgrounds[key] = background
+        return background
+
     def draw_refinery_info_panel(self, building, mouse_pos) -> None:
         """Draw a nice info panel for refinery buildings"""
         panel_width = 200
@@ -784,15 +988,9 @@ class Game:
         x = min(mouse_pos[0] + 20, WINDOW_WIDTH - panel_width - margin)
         y = max(mouse_pos[1] - panel_height - 20, margin)
         
-        # Panel background
+        # Panel background and title (pre-rendered)
         panel_rect = pygame.Rect(x, y, panel_width, panel_height)
-        pygame.draw.rect(self.screen, (45, 45, 52), panel_rect, border_radius=8)
-        pygame.draw.rect(self.screen, (80, 80, 95), panel_rect, 2, border_radius=8)
-        
-        # Title
-        title = self.font.render("REFINERY", True, (255, 255, 255))
-        title_rect = title.get_rect(midtop=(panel_rect.centerx, panel_rect.y + 10))
-        self.screen.blit(title, title_rect)
+        background = self.get_info_panel_background("REFINERY", panel_rect.size)
         
         # Resource info in a nice square
         info_x = panel_rect.x + 15
@@ -801,23 +999,26 @@ class Game:
         # Stone input section
         stone_amt = int(building.storage.get("stone", 0))
         stone_text = self.font.render(f"Stone Input: {stone_amt}", True, (200, 200, 200))
-        self.screen.blit(stone_text, (info_x, info_y))
         
         # BMAT output section
         bmat_amt = int(building.storage.get("bmats", 0))
         bmat_text = self.font.render(f"BMAT Output: {bmat_amt}", True, (255, 200, 80))
-        self.screen.blit(bmat_text, (info_x, info_y + 25))
         
         # Production rate
         rate_text = self.font.render(f"Rate: {building.production_rate_per_sec:.1f}/s", True, (150, 200, 150))
-        self.screen.blit(rate_text, (info_x, info_y + 50))
         
         # Status
         if stone_amt > 0:
             status_text = self.font.render("Status: Converting", True, (100, 200, 100))
         else:
             status_text = self.font.render("Status: Waiting for stone", True, (200, 100, 100))
-        self.screen.blit(status_text, (info_x, info_y + 75))
+        self.screen.blits([
+            (background, panel_rect),
+            (stone_text, (info_x, info_y)),
+            (bmat_text, (info_x, info_y + 25)),
+            (rate_text, (info_x, info_y + 50)),
+            (status_text, (info_x, info_y + 75)),
+        ], doreturn=False)
         
         # Loading bar for bmat production
         if stone_amt > 0:
@@ -830,11 +1031,12 @@ class Game:
             pygame.draw.rect(self.screen, (60, 60, 60), (bar_x, bar_y, bar_width, bar_height), border_radius=4)
             
             # Progress bar (5 seconds = 1 bmat)
-            if "conversion_timer" in building.__dict__:
-                progress = building.conversion_timer / 5.0
+            progress = building.conversion_timer / 5.0
+            if progress > 0:
                 progress_width = int(bar_width * progress)
                 if progress_width > 0:
-                    pygame.draw.rect(self.screen, (100, 200, 100), (bar_x, bar_y, progress_width, bar_height), border_radius=4)
+                    # Square ends: at 8px tall the rounding is not worth the rasterization cost
+                    pygame.draw.rect(self.screen, (100, 200, 100), (bar_x, bar_y, progress_width, bar_height))
             
             # Border
             pygame.draw.rect(self.screen, (120, 120, 120), (bar_x, bar_y, bar_width, bar_height), 1, border_radius=4)
@@ -849,15 +1051,9 @@ class Game:
         x = min(mouse_pos[0] + 20, WINDOW_WIDTH - panel_width - margin)
         y = max(mouse_pos[1] - panel_height - 20, margin)
         
-        # Panel background
+        # Panel background and title (pre-rendered)
         panel_rect = pygame.Rect(x, y, panel_width, panel_height)
-        pygame.draw.rect(self.screen, (45, 45, 52), panel_rect, border_radius=8)
-        pygame.draw.rect(self.screen, (80, 80, 95), panel_rect, 2, border_radius=8)
-        
-        # Title
-        title = self.font.render("QUARRY", True, (255, 255, 255))
-        title_rect = title.get_rect(midtop=(panel_rect.centerx, panel_rect.y + 10))
-        self.screen.blit(title, title_rect)
+        background = self.get_info_panel_background("QUARRY", panel_rect.size)
         
         # Stone storage info
         info_x = panel_rect.x + 15
@@ -865,11 +1061,14 @@ class Game:
         
         stone_amt = int(building.storage.get("stone", 0))
         stone_text = self.font.render(f"Stone Stored: {stone_amt}", True, (200, 200, 200))
-        self.screen.blit(stone_text, (info_x, info_y))
         
         # Production rate
         rate_text = self.font.render(f"Rate: {building.production_rate_per_sec:.1f}/s", True, (150, 200, 150))
-        self.screen.blit(rate_text, (info_x, info_y + 25))
+        self.screen.blits([
+            (background, panel_rect),
+            (stone_text, (info_x, info_y)),
+            (rate_text, (info_x, info_y + 25)),
+        ], doreturn=False)
 
     def draw_lumber_info_panel(self, building, mouse_pos) -> None:
         """Draw a nice info panel for lumber camp buildings"""
@@ -881,15 +1080,9 @@ class Game:
         x = min(mouse_pos[0] + 20, WINDOW_WIDTH - panel_width - margin)
         y = max(mouse_pos[1] - panel_height - 20, margin)
         
-        # Panel background
+        # Panel background and title (pre-rendered)
         panel_rect = pygame.Rect(x, y, panel_width, panel_height)
-        pygame.draw.rect(self.screen, (45, 45, 52), panel_rect, border_radius=8)
-        pygame.draw.rect(self.screen, (80, 80, 95), panel_rect, 2, border_radius=8)
-        
-        # Title
-        title = self.font.render("LUMBER CAMP", True, (255, 255, 255))
-        title_rect = title.get_rect(midtop=(panel_rect.centerx, panel_rect.y + 10))
-        self.screen.blit(title, title_rect)
+        background = self.get_info_panel_background("LUMBER CAMP", panel_rect.size)
         
         # Wood storage info
         info_x = panel_rect.x + 15
@@ -897,13 +1090,39 @@ class Game:
         
         wood_amt = int(building.storage.get("wood", 0))
         wood_text = self.font.render(f"Wood Stored: {wood_amt}", True, (160, 120, 60))
-        self.screen.blit(wood_text, (info_x, info_y))
         
         # Production rate
         rate_text = self.font.render(f"Rate: {building.production_rate_per_sec:.1f}/s", True, (150, 200, 150))
-        self.screen.blit(rate_text, (info_x, info_y + 25))
+        self.screen.blits([
+            (background, panel_rect),
+            (wood_text, (info_x, info_y)),
+            (rate_text, (info_x, info_y + 25)),
+        ], doreturn=False)
 
     def draw_ui(self) -> None:
+        # Resource and controls rows only change on pickup/deposit or mode toggle
+        res = self.resources
+        key = (res['oil'], res['steel'], res['wood'], res['stone'], res['bmats'], self.build_mode)
+        if self._status_text_cache is None or self._status_text_cache[0] != key:
+            self._status_text_cache = (key,) + self._render_status_text()
+        _, res_surf, controls_surf, res_bg = self._status_text_cache
+        self.draw_rounded_box(res_bg, (55, 55, 60), None, 6)
+        blit_list: List[Tuple[pygame.Surface, Tuple[int, int]]] = [(res_surf, (12, 10)), (controls_surf, (12, 34))]
+
+        # Build toolbar in build mode, re-rendered only when the selected tool changes
+        if self.build_mode:
+            if self._toolbar_layer is None or self._toolbar_layer[0] != self.current_tool:
+                self._toolbar_layer = (self.current_tool, self._render_build_toolbar())
+            blit_list.append((self._toolbar_layer[1], self._full_bar_rect.topleft))
+        self.screen.blits(blit_list, doreturn=False)
+
+        # Explore staged UI (nothing to show outside an assignment)
+        stage = self.assign_stage
+        if not self.build_mode and stage != "idle":
+            self.draw_top_banner(stage)
+            self.draw_explore_panel()
+
+    def _render_status_text(self) -> Tuple[pygame.Surface, pygame.Surface, pygame.Rect]:
         mode_text = "BUILD MODE" if self.build_mode else "EXPLORE"
         hint = "[Drag] Pan" if not self.build_mode else "[LMB Drag] Build"
         # Resources row (top-left, left to right)
@@ -919,49 +1138,56 @@ class Game:
         padding = 8
         res_pos = (12, 10)
         res_bg = pygame.Rect(res_pos[0] - 4, res_pos[1] - 4, res_surf.get_width() + padding, res_surf.get_height() + padding)
-        pygame.draw.rect(self.screen, (55, 55, 60), res_bg, border_radius=6)
-        self.screen.blit(res_surf, res_pos)
 
         # Controls row beneath
         controls_surf = self.font.render(
             f"[B] Toggle Build | {hint} | Mode: {mode_text}", True, UI_TEXT
         )
-        self.screen.blit(controls_surf, (12, 34))
-
-        # Build toolbar in build mode
-        if self.build_mode:
-            bar_rects = self.get_build_bar_rects()
-            # Draw bar background spanning its bounds
-            full_bar = self.get_full_build_bar_rect(bar_rects)
-            pygame.draw.rect(self.screen, UI_BAR_BG, full_bar, border_radius=8)
-            pygame.draw.rect(self.screen, UI_BAR_BORDER, full_bar, 2, border_radius=8)
-            for tool, rect in bar_rects.items():
-                selected = tool == self.current_tool
-                if tool == "bulldoze":
-                    bg_color = (140, 40, 40) if selected else (100, 35, 35)
-                    brd = (200, 90, 90) if selected else (150, 70, 70)
-                else:
-                    bg_color = (75, 75, 88) if selected else (62, 62, 72)
-                    brd = (130, 130, 150) if selected else (90, 90, 105)
-                pygame.draw.rect(self.screen, bg_color, rect, border_radius=6)
-                pygame.draw.rect(self.screen, brd, rect, 2, border_radius=6)
-                label = (
-                    "Road" if tool == "road" else
-                    "Lumber Camp" if tool == "lumber" else
-                    "Quarry" if tool == "quarry" else
-                    "Refinery" if tool == "refinery" else
-                    "Bulldoze"
-                )
-                tsurf = self.font.render(label, True, UI_TEXT)
-                tx = rect.x + (rect.width - tsurf.get_width()) // 2
-                ty = rect.y + (rect.height - tsurf.get_height()) // 2
-                self.screen.blit(tsurf, (tx, ty))
-
-        # Explore staged UI
-        self.draw_top_banner()
-        self.draw_explore_panel()
+        return res_surf, controls_surf, res_bg
+
+    def _render_build_toolbar(self) -> pygame.Surface:
+        bar_rects = self.get_build_bar_rects()
+        if self._full_bar_rect is None:
+            self._full_bar_rect = self.get_full_build_bar_rect(bar_rects)
+        full_bar = self._full_bar_rect
+        layer = pygame.Surface(full_bar.size, pygame.SRCALPHA)
+        ox, oy = full_bar.topleft
+        # Draw bar background spanning its bounds
+        pygame.draw.rect(layer, UI_BAR_BG, layer.get_rect(), border_radius=8)
+        pygame.draw.rect(layer, UI_BAR_BORDER, layer.get_rect(), 2, border_radius=8)
+        for tool, screen_rect in bar_rects.items():
+            selected = tool == self.current_tool
+            button = self._button_surfaces.get((tool, selected))
+            if button is None:
+                button = self._render_tool_button(tool, screen_rect.size, selected)
+                self._button_surfaces[(tool, selected)] = button
+            layer.blit(button, (screen_rect.x - ox, screen_rect.y - oy))
+        return layer
+
+    def _render_tool_button(self, tool: str, size: Tuple[int, int], selected: bool) -> pygame.Surface:
+        button = pygame.Surface(size, pygame.SRCALPHA)
+        rect = button.get_rect()
+        if tool == "bulldoze":
+            bg_color = (140, 40, 40) if selected else (100, 35, 35)
+            brd = (200, 90, 90) if selected else (150, 70, 70)
+        else:
+            bg_color = (75, 75, 88) if selected else (62, 62, 72)
+            brd = (130, 130, 150) if selected else (90, 90, 105)
+        pygame.draw.rect(button, bg_color, rect, border_radius=6)
+        pygame.draw.rect(button, brd, rect, 2, border_radius=6)
+        tsurf = self.font.render(TOOL_LABELS[tool], True, UI_TEXT)
+        tx = (rect.width - tsurf.get_width()) // 2
+        ty = (rect.height - tsurf.get_height()) // 2
+        button.blit(tsurf, (tx, ty))
+        return button
 
     def get_build_bar_rects(self) -> Dict[str, pygame.Rect]:
+        # Fixed layout: build it once and hand out the same rects
+        if self._bar_rects_cache is None:
+            self._bar_rects_cache = self._layout_build_bar_rects()
+        return self._bar_rects_cache
+
+    def _layout_build_bar_rects(self) -> Dict[str, pygame.Rect]:
         # Horizontal bar at bottom
         margin = 12
         button_w = 150
@@ -980,37 +1206,28 @@ class Game:
         return rects
 
     def get_full_build_bar_rect(self, rects: Dict[str, pygame.Rect]) -> pygame.Rect:
-        # Compute bounding rect around given button rects
-        xs = [r.x for r in rects.values()]
-        ys = [r.y for r in rects.values()]
-        ws = [r.x + r.w for r in rects.values()]
-        hs = [r.y + r.h for r in rects.values()]
-        x = min(xs) - 8
-        y = min(ys) - 8
-        w = max(ws) - x + 8
-        h = max(hs) - y + 8
-        return pygame.Rect(x, y, w, h)
+        # Bounding rect around given button rects with an 8px margin
+        buttons = list(rects.values())
+        return buttons[0].unionall(buttons[1:]).inflate(16, 16)
 
     # -------- Explore mode staged UI --------
-    def draw_top_banner(self) -> None:
-        if self.build_mode:
-            return
-        text: Optional[str] = None
-        if self.assign_stage == "choose_truck":
-            text = "Choose a truck at the base"
-        elif self.assign_stage == "choose_source":
-            text = "Fetching where? Click a source (e.g., Lumber Camp)"
-        elif self.assign_stage == "choose_resource":
-            text = "Choose resource to fetch"
-        elif self.assign_stage == "confirm":
-            text = "Confirm assignment and toggle repeat if desired"
+    def draw_top_banner(self, stage: str) -> None:
+        # Only called from draw_ui in explore mode
+        text = BANNER_TEXTS.get(stage)
         if text:
             surf = self.font.render(text, True, UI_TEXT)
             bg = pygame.Rect(8, 56, surf.get_width() + 16, surf.get_height() + 10)
-            pygame.draw.rect(self.screen, (55, 55, 60), bg, border_radius=6)
+            self.draw_rounded_box(bg, (55, 55, 60), None, 6)
             self.screen.blit(surf, (bg.x + 8, bg.y + 5))
 
     def get_truck_panel_rects(self) -> Dict[str, pygame.Rect]:
+        # Layout only depends on which trucks exist
+        key = tuple(t.truck_id for t in self.trucks)
+        if self._truck_panel_cache is None or self._truck_panel_cache[0] != key:
+            self._truck_panel_cache = (key, self._layout_truck_panel_rects())
+        return self._truck_panel_cache[1]
+
+    def _layout_truck_panel_rects(self) -> Dict[str, pygame.Rect]:
         margin = 12
         panel_h = 100
         panel_rect = pygame.Rect(8, WINDOW_HEIGHT - panel_h - margin, WINDOW_WIDTH - 16, panel_h)
@@ -1035,6 +1252,13 @@ class Game:
         return rects
 
     def get_resource_panel_rects(self) -> Dict[str, pygame.Rect]:
+        # Layout only depends on which resource buttons are offered
+        options = tuple(self.get_resource_options())
+        if self._resource_panel_cache is None or self._resource_panel_cache[0] != options:
+            self._resource_panel_cache = (options, self._layout_resource_panel_rects(options))
+        return self._resource_panel_cache[1]
+
+    def _layout_resource_panel_rects(self, options: Tuple[str, ...]) -> Dict[str, pygame.Rect]:
         margin = 12
         panel_h = 100
         panel_rect = pygame.Rect(8, WINDOW_HEIGHT - panel_h - margin, WINDOW_WIDTH - 16, panel_h)
@@ -1043,6 +1267,14 @@ class Game:
         y = panel_rect.y + 12
         btn_w = 140
         btn_h = 36
+        for opt in options:
+            key = f"res_{opt}"
+            rects[key] = pygame.Rect(x, y, btn_w, btn_h)
+            x += btn_w + 10
+        rects["cancel"] = pygame.Rect(panel_rect.right - btn_w - 12, y, btn_w, btn_h)
+        return rects
+
+    def get_resource_options(self) -> List[str]:
         # Determine options from source building type and destination
         options: List[str] = []
         if self.pending_source is not None:
@@ -1073,14 +1305,15 @@ class Game:
         
         if not options:
             options = ["wood"]
-        for opt in options:
-            key = f"res_{opt}"
-            rects[key] = pygame.Rect(x, y, btn_w, btn_h)
-            x += btn_w + 10
-        rects["cancel"] = pygame.Rect(panel_rect.right - btn_w - 12, y, btn_w, btn_h)
-        return rects
+        return options
 
     def get_confirm_panel_rects(self) -> Dict[str, pygame.Rect]:
+        # Fixed layout: build it once and hand out the same rects
+        if self._confirm_panel_cache is None:
+            self._confirm_panel_cache = self._layout_confirm_panel_rects()
+        return self._confirm_panel_cache
+
+    def _layout_confirm_panel_rects(self) -> Dict[str, pygame.Rect]:
         margin = 12
         panel_h = 100
         panel_rect = pygame.Rect(8, WINDOW_HEIGHT - panel_h - margin, WINDOW_WIDTH - 16, panel_h)
@@ -1095,22 +1328,17 @@ class Game:
         return rects
 
     def draw_explore_panel(self) -> None:
-        if self.build_mode:
-            return
-        if self.assign_stage == "idle":
-            return
+        # Only called from draw_ui in explore mode with an assignment in progress
         # Choose Truck panel
         if self.assign_stage == "choose_truck":
             rects = self.get_truck_panel_rects()
             panel = rects["panel"]
-            pygame.draw.rect(self.screen, UI_BAR_BG, panel, border_radius=8)
-            pygame.draw.rect(self.screen, UI_BAR_BORDER, panel, 2, border_radius=8)
+            self.draw_rounded_box(panel, UI_BAR_BG, UI_BAR_BORDER, 8)
             
             # Draw truck buttons
             for t in self.trucks:
                 r = rects[f"truck_{t.truck_id}"]
-                pygame.draw.rect(self.screen, (62, 62, 72), r, border_radius=6)
-                pygame.draw.rect(self.screen, (90, 90, 105), r, 2, border_radius=6)
+                self.draw_rounded_box(r, (62, 62, 72), (90, 90, 105), 6)
                 label = f"Truck {t.truck_id} ({t.state})"
                 ts = self.font.render(label, True, UI_TEXT)
                 self.blit_text_clipped(ts, r)
@@ -1120,8 +1348,7 @@ class Game:
             can_afford = self.resources.get("bmats", 0) >= self.truck_factory.get_truck_cost()
             bg_color = (60, 120, 60) if can_afford else (80, 80, 80)
             border_color = (80, 160, 80) if can_afford else (100, 100, 100)
-            pygame.draw.rect(self.screen, bg_color, add_btn, border_radius=6)
-            pygame.draw.rect(self.screen, border_color, add_btn, 2, border_radius=6)
+            self.draw_rounded_box(add_btn, bg_color, border_color, 6)
             
             # Show cost and + symbol
             cost = self.truck_factory.get_truck_cost()
@@ -1131,59 +1358,46 @@ class Game:
             
             # Cancel button
             rcancel = rects["cancel"]
-            pygame.draw.rect(self.screen, (120, 70, 70), rcancel, border_radius=6)
-            pygame.draw.rect(self.screen, (90, 90, 105), rcancel, 2, border_radius=6)
-            tsca = self.font.render("Cancel", True, UI_TEXT)
-            self.blit_text_clipped(tsca, rcancel)
+            self.draw_rounded_box(rcancel, (120, 70, 70), (90, 90, 105), 6)
+            self.blit_text_clipped(self._cancel_label, rcancel)
             return
         # Choose Resource panel
         if self.assign_stage == "choose_resource":
             rects = self.get_resource_panel_rects()
             panel = rects["panel"]
-            pygame.draw.rect(self.screen, UI_BAR_BG, panel, border_radius=8)
-            pygame.draw.rect(self.screen, UI_BAR_BORDER, panel, 2, border_radius=8)
+            self.draw_rounded_box(panel, UI_BAR_BG, UI_BAR_BORDER, 8)
             for key, r in rects.items():
                 if key == "panel" or key == "cancel":
                     continue
-                pygame.draw.rect(self.screen, (62, 62, 72), r, border_radius=6)
-                pygame.draw.rect(self.screen, (90, 90, 105), r, 2, border_radius=6)
+                self.draw_rounded_box(r, (62, 62, 72), (90, 90, 105), 6)
                 label = "Wood" if key.endswith("wood") else "Stone" if key.endswith("stone") else "BMATS"
                 ts2 = self.font.render(label, True, UI_TEXT)
                 self.blit_text_clipped(ts2, r)
             rcancel = rects["cancel"]
-            pygame.draw.rect(self.screen, (120, 70, 70), rcancel, border_radius=6)
-            pygame.draw.rect(self.screen, (90, 90, 105), rcancel, 2, border_radius=6)
-            tsca = self.font.render("Cancel", True, UI_TEXT)
-            self.blit_text_clipped(tsca, rcancel)
+            self.draw_rounded_box(rcancel, (120, 70, 70), (90, 90, 105), 6)
+            self.blit_text_clipped(self._cancel_label, rcancel)
             return
         # Confirm panel
         if self.assign_stage == "confirm":
             rects = self.get_confirm_panel_rects()
             panel = rects["panel"]
-            pygame.draw.rect(self.screen, UI_BAR_BG, panel, border_radius=8)
-            pygame.draw.rect(self.screen, UI_BAR_BORDER, panel, 2, border_radius=8)
+            self.draw_rounded_box(panel, UI_BAR_BG, UI_BAR_BORDER, 8)
             rconf = rects["confirm"]
             rrepeat = rects["repeat"]
             rcancel = rects["cancel"]
             ready = self.pending_source is not None and self.pending_destination is not None and self.pending_truck_id is not None and self.pending_resource is not None
-            pygame.draw.rect(self.screen, (70, 120, 70) if ready else (60, 70, 60), rconf, border_radius=6)
-            pygame.draw.rect(self.screen, (90, 90, 105), rconf, 2, border_radius=6)
-            tsc = self.font.render("Confirm", True, UI_TEXT)
-            self.blit_text_clipped(tsc, rconf)
+            self.draw_rounded_box(rconf, (70, 120, 70) if ready else (60, 70, 60), (90, 90, 105), 6)
+            self.blit_text_clipped(self._confirm_label, rconf)
             # Repeat toggle
             repeat_on = False
             if self.pending_truck_id is not None:
                 tsel = self.get_truck_by_id(self.pending_truck_id)
                 repeat_on = bool(tsel and tsel.repeat_enabled)
-            pygame.draw.rect(self.screen, (90, 120, 160) if repeat_on else (62, 62, 72), rrepeat, border_radius=6)
-            pygame.draw.rect(self.screen, (130, 160, 190) if repeat_on else (90, 90, 105), rrepeat, 2, border_radius=6)
-            tsr = self.font.render("Repeat", True, UI_TEXT)
-            self.blit_text_clipped(tsr, rrepeat)
+            self.draw_rounded_box(rrepeat, (90, 120, 160) if repeat_on else (62, 62, 72), (130, 160, 190) if repeat_on else (90, 90, 105), 6)
+            self.blit_text_clipped(self._repeat_label, rrepeat)
             # Cancel
-            pygame.draw.rect(self.screen, (120, 70, 70), rcancel, border_radius=6)
-            pygame.draw.rect(self.screen, (90, 90, 105), rcancel, 2, border_radius=6)
-            tsca = self.font.render("Cancel", True, UI_TEXT)
-            self.blit_text_clipped(tsca, rcancel)
+            self.draw_rounded_box(rcancel, (120, 70, 70), (90, 90, 105), 6)
+            self.blit_text_clipped(self._cancel_label, rcancel)
             return
 
     def handle_explore_ui_click(self, pos: Tuple[int, int]) -> bool:
@@ -1200,13 +1414,12 @@ class Game:
                 return True
             
             # Check if any truck button was clicked
-            for t in self.trucks:
-                r = rects[f"truck_{t.truck_id}"]
-                if r.collidepoint(pos):
-                    self.pending_truck_id = t.truck_id
-                    # After choosing truck, move to choose_source and hide panel
-                    self.assign_stage = "choose_source"
-                    return True
+            idx = pygame.Rect(pos, (1, 1)).collidelist([rects[f"truck_{t.truck_id}"] for t in self.trucks])
+            if idx != -1:
+                self.pending_truck_id = self.trucks[idx].truck_id
+                # After choosing truck, move to choose_source and hide panel
+                self.assign_stage = "choose_source"
+                return True
             
             # Check if cancel was clicked
             if rects["cancel"].collidepoint(pos):
@@ -1218,11 +1431,12 @@ class Game:
             if not rects["panel"].collidepoint(pos):
                 return False
             # Check all possible resource buttons
-            for key, r in rects.items():
-                if key.startswith("res_") and r.collidepoint(pos):
-                    self.pending_resource = key.split("_", 1)[1]
-                    self.assign_stage = "confirm"
-                    return True
+            res_keys = [key for key in rects if key.startswith("res_")]
+            idx = pygame.Rect(pos, (1, 1)).collidelist([rects[key] for key in res_keys])
+            if idx != -1:
+                self.pending_resource = res_keys[idx].split("_", 1)[1]
+                self.assign_stage = "confirm"
+                return True
             if rects["cancel"].collidepoint(pos):
                 self.clear_pending_selection()
                 return True
@@ -1282,14 +1496,14 @@ class Game:
         
         # Check if either source OR destination is refinery - we want to set up stone delivery
         if (dest_building and dest_building.type == "refinery") or (source_building and source_building.type == "refinery"):
-            print(f"=== DEBUG: Refinery route assignment for Truck {truck.truck_id} ===")
-            print(f"DEBUG: Will auto-load 5 stone from base for refinery")
-            print(f"DEBUG: Source: {source}, Destination: {dest}, Resource: {resource}")
-            print(f"DEBUG: Truck current position: {truck.current_cell}")
-            print(f"DEBUG: Base area check: {self.is_cell_in_base_area(truck.current_cell)}")
+            log.debug("Refinery route assignment for Truck %s", truck.truck_id)
+            log.debug("Will auto-load 5 stone from base for refinery")
+            log.debug("Source: %s, Destination: %s, Resource: %s", source, dest, resource)
+            log.debug("Truck current position: %s", truck.current_cell)
+            log.debug("Base area check: %s", self.is_cell_in_base_area(truck.current_cell))
             
             # Force the route to be base → refinery with stone resource
-            print(f"DEBUG: Converting route to base → refinery with stone")
+            log.debug("Converting route to base → refinery with stone")
             
             # Determine which cell is the refinery
             if dest_building and dest_building.type == "refinery":
@@ -1297,30 +1511,30 @@ class Game:
             elif source_building and source_building.type == "refinery":
                 refinery_cell = source
             else:
-                print(f"ERROR: No refinery found in route")
+                log.warning("No refinery found in route")
                 return
                 
             # Always set up as base → refinery with stone
             source = self.base_cell     # Force source to be base
             dest = refinery_cell        # Force destination to be refinery
             resource = "stone"          # Force resource to be stone
-            print(f"DEBUG: Corrected route: {source} → {dest} ({resource})")
+            log.debug("Corrected route: %s → %s (%s)", source, dest, resource)
             
             # Check if base has stone available
             base_stone = self.resources.get("stone", 0)
             if base_stone >= 5:
-                print(f"DEBUG: Base has {base_stone} stone, will load 5 for refinery")
+                log.debug("Base has %s stone, will load 5 for refinery", base_stone)
                 # Always route truck to base first to load stone, then to refinery
                 if not self.is_cell_in_base_area(truck.current_cell):
-                    print(f"DEBUG: Truck {truck.truck_id} routing to base first to load stone")
+                    log.debug("Truck %s routing to base first to load stone", truck.truck_id)
                     # Define start_cell here since it's not defined yet
                     truck_start_cell = self.find_nearest_road_to_cell(self.world_pos_to_cell(truck.position_px))
-                    base_road = self.find_nearest_road_to_cell(self.base_cell)
+                    base_road = self.get_base_road()
                     if base_road:
                         path_to_base = self.find_path_on_roads(truck_start_cell, base_road)
                         if path_to_base:
                             path_to_base.append(self.base_cell)
-                            truck.path_cells = path_to_base
+                            truck.set_path(path_to_base)
                             truck.state = "to_source"
                             truck.cargo_type = "stone"
                             truck.current_cell = truck_start_cell
@@ -1330,17 +1544,17 @@ class Game:
                             truck.saved_resource = "stone"
                             truck.refinery_loop = True
                             truck.auto_stone_pickup = True
-                            print(f"DEBUG: Truck {truck.truck_id} routing to base first to load stone for refinery")
+                            log.debug("Truck %s routing to base first to load stone for refinery", truck.truck_id)
                             return
                         else:
-                            print(f"ERROR: No path to base found for truck {truck.truck_id}")
+                            log.warning("No path to base found for truck %s", truck.truck_id)
                             return
                     else:
-                        print(f"ERROR: No road to base found")
+                        log.warning("No road to base found")
                         return
                 else:
                     # Truck is already at base, but still need to load stone first
-                    print(f"DEBUG: Truck {truck.truck_id} already at base, but needs to load stone first")
+                    log.debug("Truck %s already at base, but needs to load stone first", truck.truck_id)
                     # Route through base loading process even though we're already there
                     truck.state = "to_source"
                     truck.cargo_type = "stone"
@@ -1350,38 +1564,38 @@ class Game:
                     truck.saved_resource = "stone"
                     truck.refinery_loop = True
                     truck.auto_stone_pickup = True
-                    print(f"DEBUG: Truck {truck.truck_id} set to load stone from base, then go to refinery")
+                    log.debug("Truck %s set to load stone from base, then go to refinery", truck.truck_id)
                     return
             else:
-                print(f"ERROR: Base only has {base_stone} stone, need at least 5 for refinery")
+                log.warning("Base only has %s stone, need at least 5 for refinery", base_stone)
                 return
         start_cell = self.find_nearest_road_to_cell(self.world_pos_to_cell(truck.position_px))
         source_road = self.find_nearest_road_to_cell(source)
         dest_road = self.find_nearest_road_to_cell(dest)
         
-        print(f"=== DEBUG: Normal route assignment ===")
-        print(f"DEBUG: Truck {truck.truck_id} route: {source} -> {dest} ({resource})")
-        print(f"DEBUG: start_cell: {start_cell}, source_road: {source_road}, dest_road: {dest_road}")
+        log.debug("Normal route assignment")
+        log.debug("Truck %s route: %s -> %s (%s)", truck.truck_id, source, dest, resource)
+        log.debug("start_cell: %s, source_road: %s, dest_road: %s", start_cell, source_road, dest_road)
         
         if start_cell is None or source_road is None or dest_road is None:
-            print(f"ERROR: No path found: start_road={start_cell}, source_road={source_road}, dest_road={dest_road}")
+            log.warning("No path found: start_road=%s, source_road=%s, dest_road=%s", start_cell, source_road, dest_road)
             return
         
-        print(f"Pathfinding: truck at {self.world_pos_to_cell(truck.position_px)} -> start_road={start_cell}, source_road={source_road}, dest_road={dest_road}")
+        log.debug("Pathfinding: truck at %s -> start_road=%s, source_road=%s, dest_road=%s", self.world_pos_to_cell(truck.position_px), start_cell, source_road, dest_road)
         
         # Special handling for base → refinery assignments
         if source == self.base_cell and resource == "stone":
             # For base → refinery, truck needs to go to base first to load stone
             if not self.is_cell_in_base_area(truck.current_cell):
-                print(f"Truck {truck.truck_id} not at base, routing to base first to load stone")
+                log.debug("Truck %s not at base, routing to base first to load stone", truck.truck_id)
                 # Route truck to base first
-                base_road = self.find_nearest_road_to_cell(self.base_cell)
+                base_road = self.get_base_road()
                 if base_road:
                     path_to_base = self.find_path_on_roads(start_cell, base_road)
                     if path_to_base:
                         # Add the base cell so truck can enter it
                         path_to_base.append(self.base_cell)
-                        truck.path_cells = path_to_base
+                        truck.set_path(path_to_base)
                         truck.state = "to_source"
                         truck.cargo_type = resource
                         truck.current_cell = start_cell
@@ -1390,24 +1604,24 @@ class Game:
                         truck.saved_dest = dest
                         truck.saved_resource = resource
                         truck.refinery_loop = True
-                        print(f"Truck {truck.truck_id} routing to base first to load stone for refinery")
+                        log.debug("Truck %s routing to base first to load stone for refinery", truck.truck_id)
                         return
                     else:
-                        print(f"No path to base found for truck {truck.truck_id}")
+                        log.debug("No path to base found for truck %s", truck.truck_id)
                         return
                 else:
-                    print(f"No road to base found")
+                    log.debug("No road to base found")
                     return
             else:
                 # Truck is already at base, go directly to refinery
-                print(f"Truck {truck.truck_id} already at base, going directly to refinery")
+                log.debug("Truck %s already at base, going directly to refinery", truck.truck_id)
                 refinery_road = self.find_nearest_road_to_cell(dest)
                 if refinery_road:
                     path_to_refinery = self.find_path_on_roads(start_cell, refinery_road)
                     if path_to_refinery:
                         # Add the refinery cell so truck can enter it
                         path_to_refinery.append(dest)
-                        truck.path_cells = path_to_refinery
+                        truck.set_path(path_to_refinery)
                         truck.state = "to_dest"  # Going directly to destination
                         truck.cargo_type = resource
                         truck.current_cell = start_cell
@@ -1416,34 +1630,35 @@ class Game:
                         truck.saved_dest = dest
                         truck.saved_resource = resource
                         truck.refinery_loop = True
-                        print(f"Truck {truck.truck_id} going directly to refinery from base")
+                        log.debug("Truck %s going directly to refinery from base", truck.truck_id)
                         return
                     else:
-                        print(f"No path to refinery found for truck {truck.truck_id}")
+                        log.debug("No path to refinery found for truck %s", truck.truck_id)
                         return
                 else:
-                    print(f"No road to refinery found")
+                    log.debug("No road to refinery found")
                     return
         
         # Special handling for buildings very close to base
         # If source and dest are close, we need to ensure proper pathfinding
-        source_to_base_distance = abs(source[0] - self.base_cell[0]) + abs(source[1] - self.base_cell[1])
+        base_x, base_y = self.base_cell
+        source_to_base_distance = abs(source[0] - base_x) + abs(source[1] - base_y)
         
         if source_to_base_distance <= 3:  # Very close to base
-            print(f"Building close to base detected, using special pathfinding")
+            log.debug("Building close to base detected, using special pathfinding")
             # For close buildings, ensure we have a proper road path
             if source_road == dest_road:
                 # Same road, need to find a different path
-                print(f"Source and destination share same road, finding alternative path")
+                log.debug("Source and destination share same road, finding alternative path")
                 # Try to find a path through the base area
-                base_road = self.find_nearest_road_to_cell(self.base_cell)
+                base_road = self.get_base_road()
                 if base_road and base_road != source_road:
                     # Route through base: truck -> base -> source -> base
                     path1 = self.find_path_on_roads(start_cell, base_road)
                     if path1:
                         # Add the source building to the path so truck can enter it
                         path1.append(source)
-                        truck.path_cells = path1
+                        truck.set_path(path1)
                         truck.state = "to_source"
                         truck.cargo_type = resource
                         truck.current_cell = start_cell
@@ -1453,19 +1668,19 @@ class Game:
                         truck.saved_resource = resource
                         return
                 else:
-                    print(f"Cannot find alternative path for close building")
+                    log.debug("Cannot find alternative path for close building")
                     return
         
         # Normal pathfinding for buildings further from base
         # Find path from truck to source building (via roads only)
         path1 = self.find_path_on_roads(start_cell, source_road)
         if not path1:
-            print(f"No road path found from truck to source building")
+            log.debug("No road path found from truck to source building")
             return
         
         # The path should only contain road cells - trucks can't move to non-road cells
         # The source building will be handled when the truck reaches the last road cell
-        truck.path_cells = path1
+        truck.set_path(path1)
         truck.state = "to_source"
         truck.cargo_type = resource
         truck.current_cell = start_cell
@@ -1480,7 +1695,7 @@ class Game:
             dest_building = self.get_building_at_cell(dest)
             if dest_building and dest_building.type == "refinery":
                 truck.refinery_loop = True
-                print(f"Truck {truck.truck_id} set up for refinery stone delivery loop from base")
+                log.debug("Truck %s set up for refinery stone delivery loop from base", truck.truck_id)
         
         # Special handling for refinery assignments
         if resource == "stone" and dest != self.base_cell:
@@ -1488,19 +1703,13 @@ class Game:
             dest_building = self.get_building_at_cell(dest)
             if dest_building and dest_building.type == "refinery":
                 truck.refinery_loop = True
-                print(f"Truck {truck.truck_id} set up for refinery stone delivery loop")
+                log.debug("Truck %s set up for refinery stone delivery loop", truck.truck_id)
 
     def get_truck_by_id(self, truck_id: int) -> Optional[Truck]:
-        for t in self.trucks:
-            if t.truck_id == truck_id:
-                return t
-        return None
+        return self.trucks_by_id.get(truck_id)
 
     def get_building_at_cell(self, cell: Coord) -> Optional[Building]:
-        for b in self.buildings:
-            if b.cell == cell:
-                return b
-        return None
+        return self.buildings_by_cell.get(cell)
 
     # -------- Roads and pathfinding --------
     def world_pos_to_cell(self, pos_px: Tuple[float, float]) -> Coord:
@@ -1510,18 +1719,34 @@ class Game:
         return cell in self.roads
 
     def is_driveable(self, cell: Coord) -> bool:
-        """Check if a tile is driveable (has road value 1)"""
-        return self.road_grid.get(cell, 0) == 1
-
-    def neighbors4(self, cell: Coord) -> List[Coord]:
-        x, y = cell
-        return [(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)]
+        """Check if a tile is driveable (is in the road grid)"""
+        return cell in self.road_grid
 
-    def find_nearest_road_to_cell(self, cell: Coord, max_dist: int = 12) -> Optional[Coord]:
-        if self.is_driveable(cell):
+    def find_nearest_road_to_cell(self, cell: Coord, max_dist: int = NEAREST_ROAD_RADIUS) -> Optional[Coord]:
+        if cell in self.road_grid:
             return cell
-        # expand rings
+        if max_dist > NEAREST_ROAD_RADIUS:
+            return self._search_nearest_road(cell, max_dist)
+        entry = self.get_nearest_road_field().nearest.get(cell)
+        if entry is None or entry[1] > max_dist:
+            return None
+        return entry[0]
+
+    def get_base_road(self) -> Optional[Coord]:
+        if self._base_road_version != self.roads_version:
+            self._base_road = self.find_nearest_road_to_cell(self.base_cell)
+            self._base_road_version = self.roads_version
+        return self._base_road
+
+    def get_nearest_road_field(self) -> NearestRoadField:
+        if self._nearest_road_field is None:
+            self._nearest_road_field = NearestRoadField(self.road_grid, NEAREST_ROAD_RADIUS)
+        return self._nearest_road_field
+
+    def _search_nearest_road(self, cell: Coord, max_dist: int) -> Optional[Coord]:
+        # expand rings (only for searches wider than the precomputed field)
         cx, cy = cell
+        road_grid = self.road_grid
         for d in range(1, max_dist + 1):
             for dx in range(-d, d + 1):
                 dy = d - abs(dx)
@@ -1529,56 +1754,76 @@ class Game:
                     ny = cy + sy * dy
                     nx = cx + dx
                     cand = (nx, ny)
-                    if self.is_driveable(cand):
+                    if cand in road_grid:
                         return cand
         return None
 
+    def invalidate_road_caches(self) -> None:
+        self.roads_version += 1
+        self._road_dsu = None
+        self._nearest_road_field = None
+        self._path_cache.clear()
+
+    def road_cell_added(self, cell: Coord) -> None:
+        # Adding a cell can only merge networks and bring roads closer,
+        # so the union-find and nearest-road field are extended in place
+        self.roads_version += 1
+        self._path_cache.clear()
+        if self._road_dsu is not None:
+            self._road_dsu.add_cell(cell)
+        if self._nearest_road_field is not None:
+            self._nearest_road_field.add_road(cell)
+
+    def get_road_dsu(self) -> UnionFind:
+        if self._road_dsu is None:
+            self._road_dsu = UnionFind(self.road_grid)
+        return self._road_dsu
+
     def find_path_on_roads(self, start: Coord, goal: Coord) -> List[Coord]:
         if start == goal:
             return [start]
-        from collections import deque
-        queue = deque([start])
-        came: Dict[Coord, Optional[Coord]] = {start: None}
-        while queue:
-            cur = queue.popleft()
-            if cur == goal:
-                break
-            for nb in self.neighbors4(cur):
-                # Only move to driveable road cells
-                if self.is_driveable(nb) and nb not in came:
-                    came[nb] = cur
-                    queue.append(nb)
-        if goal not in came:
+        # Callers consume paths in place, so hand out copies of cached routes
+        cached = self._path_cache.get((start, goal))
+        if cached is not None:
+            self._path_cache.move_to_end((start, goal))
+            return list(cached)
+        # Skip the search when the goal is off-road or on a different road network
+        dsu = self.get_road_dsu()
+        if goal not in dsu or (start in dsu and dsu.find(start) != dsu.find(goal)):
+            self._cache_path(start, goal, [])
             return []
-        # reconstruct
-        path: List[Coord] = []
-        cur: Optional[Coord] = goal
-        while cur is not None:
-            path.append(cur)
-            cur = came[cur]
-        path.reverse()
-        return path
+        path = bfs_path(self.road_grid, start, goal)
+        self._cache_path(start, goal, path)
+        if path and start in self.road_grid:
+            # Roads are undirected, so the reversed route is a shortest path back
+            self._cache_path(goal, start, path[::-1])
+        return list(path)
+
+    def _cache_path(self, start: Coord, goal: Coord, path: List[Coord]) -> None:
+        cache = self._path_cache
+        cache[(start, goal)] = path
+        cache.move_to_end((start, goal))
+        if len(cache) > PATH_CACHE_SIZE:
+            cache.popitem(last=False)
 
 
 
     def is_cell_connected_to_base_by_roads(self, cell: Coord) -> bool:
         # Check path between nearest driveable road to cell and nearest driveable road to base
         start = self.find_nearest_road_to_cell(cell)
-        goal = self.find_nearest_road_to_cell(self.base_cell)
+        goal = self.get_base_road()
         if start is None or goal is None:
             return False
-        return len(self.find_path_on_roads(start, goal)) > 0
+        return self.get_road_dsu().connected(start, goal)
 
     def is_cell_in_base_area(self, cell: Coord) -> bool:
         """Check if a cell is within the 2x2 base area"""
-        bx, by = self.base_cell
-        return bx <= cell[0] <= bx + 1 and by <= cell[1] <= by + 1
+        return cell in self._base_area_cells
 
     def is_cell_adjacent_to_base(self, cell: Coord) -> bool:
         """Check if a cell is directly adjacent to the base area (including diagonals)"""
-        bx, by = self.base_cell
-        # Check if cell is in the 4x4 area around the 2x2 base
-        return (bx - 1 <= cell[0] <= bx + 2) and (by - 1 <= cell[1] <= by + 2)
+        # Cells in the 4x4 area around the 2x2 base
+        return cell in self._base_adjacent_cells
 
     def center_camera_on_cell(self, cell: Coord) -> None:
         cx, cy = cell
@@ -1597,30 +1842,43 @@ class Game:
         self.camera_y = int(center_y - WINDOW_HEIGHT // 2)
 
     # -------- Update & Main loop --------
+    def get_active_producers(self) -> List[Building]:
+        key = (self._buildings_version, self.roads_version)
+        if self._active_producers_key != key:
+            roads_version = self.roads_version
+            active: List[Building] = []
+            for b in self.buildings:
+                if b.production_rate_per_sec <= 0:
+                    continue
+                # Connectivity only changes with the road grid
+                if b._conn_version != roads_version:
+                    b._conn_cached = self.is_cell_connected_to_base_by_roads(b.cell)
+                    b._conn_version = roads_version
+                if b._conn_cached:
+                    active.append(b)
+            self._active_producers = active
+            self._active_producers_key = key
+        return self._active_producers
+
     def update(self, dt: float) -> None:
         # Production from buildings (only if connected to base by roads)
-        for b in self.buildings:
-            if b.production_rate_per_sec <= 0:
-                continue
-            if not self.is_cell_connected_to_base_by_roads(b.cell):
-                continue
-            if b.type == "lumber":
-                b.storage["wood"] = b.storage.get("wood", 0.0) + b.production_rate_per_sec * dt
-            elif b.type == "quarry":
-                b.storage["stone"] = b.storage.get("stone", 0.0) + b.production_rate_per_sec * dt
+        for b in self.get_active_producers():
+            rate = b.production_rate_per_sec
+            storage = b.storage
+            produced = PRODUCED_RESOURCE.get(b.type)
+            if produced is not None:
+                storage[produced] = storage.get(produced, 0.0) + rate * dt
             elif b.type == "refinery":
                 # Refineries convert stone to bmats: 1 stone = 1 bmat every 5 seconds
-                stone_available = b.storage.get("stone", 0.0)
+                stone_available = storage.get("stone", 0.0)
                 if stone_available > 0:
                     # Add to conversion timer
-                    if "conversion_timer" not in b.__dict__:
-                        b.conversion_timer = 0.0
                     b.conversion_timer += dt
                     
                     # Every 5 seconds, convert 1 stone to 1 bmat
                     if b.conversion_timer >= 5.0:
-                        b.storage["stone"] = stone_available - 1.0
-                        b.storage["bmats"] = b.storage.get("bmats", 0.0) + 1.0
+                        storage["stone"] = stone_available - 1.0
+                        storage["bmats"] = storage.get("bmats", 0.0) + 1.0
                         b.conversion_timer = 0.0  # Reset timer
 
         # Truck movement and logistics
@@ -1630,92 +1888,94 @@ class Game:
     def update_truck(self, t: Truck, dt: float) -> None:
         # Add debugging for Truck 2 specifically
         if t.truck_id == 2:
-            if not hasattr(t, 'debug_timer'):
-                t.debug_timer = 0.0
             t.debug_timer += dt
             
             # Print debug info every 3 seconds for Truck 2
             if t.debug_timer > 3.0:
-                print(f"=== DEBUG: Truck 2 Status ===")
-                print(f"DEBUG: State: {t.state}")
-                print(f"DEBUG: Position: {t.current_cell}")
-                print(f"DEBUG: Cargo: {t.cargo_type} x{t.cargo_amount}")
-                print(f"DEBUG: Path cells remaining: {len(t.path_cells) if t.path_cells else 0}")
-                print(f"DEBUG: Refinery loop: {getattr(t, 'refinery_loop', False)}")
-                print(f"DEBUG: Auto-stone pickup: {getattr(t, 'auto_stone_pickup', False)}")
-                print(f"DEBUG: Destination: {getattr(t, '_dest_cell', 'None')}")
-                print(f"DEBUG: Saved source: {getattr(t, 'saved_source', 'None')}")
-                print(f"DEBUG: Saved dest: {getattr(t, 'saved_dest', 'None')}")
+                log.debug("Truck 2 Status")
+                log.debug("State: %s", t.state)
+                log.debug("Position: %s", t.current_cell)
+                log.debug("Cargo: %s x%s", t.cargo_type, t.cargo_amount)
+                log.debug("Path cells remaining: %s", len(t.path_cells) - t.path_index)
+                log.debug("Refinery loop: %s", t.refinery_loop)
+                log.debug("Auto-stone pickup: %s", t.auto_stone_pickup)
+                log.debug("Destination: %s", t._dest_cell)
+                log.debug("Saved source: %s", t.saved_source)
+                log.debug("Saved dest: %s", t.saved_dest)
                 t.debug_timer = 0.0
         
         # Check if truck is already at source with no path (needs to load cargo)
         if t.state == "to_source" and not t.path_cells:
-            print(f"DEBUG: Truck {t.truck_id} is at source with no path, checking for loading")
+            log.debug("Truck %s is at source with no path, checking for loading", t.truck_id)
             self.on_truck_arrival(t)
             return
         
         # Move along path if any
         if t.path_cells:
             # Move towards next cell center
-            next_cell = t.path_cells[0]
-            target_px = (
-                next_cell[0] * GRID_SIZE + GRID_SIZE // 2,
-                next_cell[1] * GRID_SIZE + GRID_SIZE // 2,
-            )
-            vx = target_px[0] - t.position_px[0]
-            vy = target_px[1] - t.position_px[1]
-            dist = (vx * vx + vy * vy) ** 0.5
-            if dist < 1e-3:
+            next_cell = t.path_cells[t.path_index]
+            if next_cell != t.target_cell:
+                t.target_cell = next_cell
+                t.target_px = (
+                    float(next_cell[0] * GRID_SIZE + GRID_SIZE // 2),
+                    float(next_cell[1] * GRID_SIZE + GRID_SIZE // 2),
+                )
+                dir_x, dir_y, t.remaining_px = segment_towards(t.position_px, t.target_px)
+                t.step_dir = (dir_x, dir_y)
+            if t.remaining_px < ARRIVAL_EPSILON:
                 # Reached this cell
-                t.position_px = (float(target_px[0]), float(target_px[1]))
+                t.position_px = t.target_px
                 t.current_cell = next_cell
-                t.path_cells.pop(0)
+                t.path_index += 1
                 # If reached end of path, handle arrival state
-                if not t.path_cells:
-                    print(f"DEBUG: Truck {t.truck_id} reached end of path, calling arrival handler")
+                if t.path_index >= len(t.path_cells):
+                    t.set_path([])
+                    log.debug("Truck %s reached end of path, calling arrival handler", t.truck_id)
                     self.on_truck_arrival(t)
             else:
-                ux = vx / dist
-                uy = vy / dist
                 step = t.speed_px_per_sec * dt
-                if step >= dist:
-                    t.position_px = (float(target_px[0]), float(target_px[1]))
+                if step >= t.remaining_px:
+                    # Land exactly on the cell center; arrival is handled next frame
+                    t.position_px = t.target_px
+                    t.remaining_px = 0.0
                 else:
-                    t.position_px = (t.position_px[0] + ux * step, t.position_px[1] + uy * step)
+                    px, py = t.position_px
+                    t.position_px = (px + t.step_dir[0] * step, py + t.step_dir[1] * step)
+                    t.remaining_px -= step
 
     def on_truck_arrival(self, t: Truck) -> None:
         # Arrived to source or destination depending on state
-        print(f"=== DEBUG: on_truck_arrival called for Truck {t.truck_id} ===")
-        print(f"DEBUG: Truck state: {t.state}")
-        print(f"DEBUG: Current cell: {t.current_cell}")
-        print(f"DEBUG: Cargo: {t.cargo_type} x{t.cargo_amount}")
-        print(f"DEBUG: Auto-stone pickup: {getattr(t, 'auto_stone_pickup', False)}")
-        print(f"DEBUG: Refinery loop: {getattr(t, 'refinery_loop', False)}")
+        log.debug("on_truck_arrival called for Truck %s", t.truck_id)
+        log.debug("Truck state: %s", t.state)
+        log.debug("Current cell: %s", t.current_cell)
+        log.debug("Cargo: %s x%s", t.cargo_type, t.cargo_amount)
+        log.debug("Auto-stone pickup: %s", t.auto_stone_pickup)
+        log.debug("Refinery loop: %s", t.refinery_loop)
         
         if t.state == "to_source":
             # Check if we're at the source building (not just close to it)
-            src_cell = getattr(t, "saved_source", None)
-            print(f"DEBUG: Saved source cell: {src_cell}")
+            src_cell = t.saved_source
+            log.debug("Saved source cell: %s", src_cell)
             if src_cell is None:
-                print(f"ERROR: No saved source cell, setting truck to idle")
+                log.warning("No saved source cell, setting truck to idle")
                 t.state = "idle"
                 return
                 
             # Check if we're actually at the source building cell
-            print(f"DEBUG: Current cell: {t.current_cell}, Source cell: {src_cell}")
-            print(f"DEBUG: Cell match: {t.current_cell == src_cell}")
+            log.debug("Current cell: %s, Source cell: %s", t.current_cell, src_cell)
+            log.debug("Cell match: %s", t.current_cell == src_cell)
             
             if t.current_cell == src_cell:
-                print(f"DEBUG: Truck is at source cell, loading cargo")
+                log.debug("Truck is at source cell, loading cargo")
                 # We're at the building, load cargo
                 src_building = self.get_building_at_cell(src_cell)
-                print(f"DEBUG: Source building: {src_building}")
+                log.debug("Source building: %s", src_building)
                 
                 # Special case: base cell doesn't have a building but can still provide resources
                 if src_building is None and src_cell == self.base_cell:
-                    print(f"DEBUG: Source is base cell, proceeding with base resource loading")
+                    log.debug("Source is base cell, proceeding with base resource loading")
                 elif src_building is None:
-                    print(f"ERROR: No source building found and not at base, setting truck to idle")
+                    log.warning("No source building found and not at base, setting truck to idle")
                     t.state = "idle"
                     return
                 
@@ -1728,7 +1988,7 @@ class Game:
                         if load_amount > 0:
                             t.cargo_amount += load_amount
                             self.resources["wood"] = max(0, amount_available - load_amount)
-                            print(f"Truck {t.truck_id} loaded {load_amount} wood from base")
+                            log.info("Truck %s loaded %s wood from base", t.truck_id, load_amount)
                     else:
                         # Loading from lumber camp
                         b = src_building
@@ -1740,72 +2000,72 @@ class Game:
                             t.cargo_amount += load_amount
                             if b and b.type == "lumber":
                                 b.storage["wood"] = max(0.0, b.storage.get("wood", 0.0) - load_amount)
-                            print(f"Truck {t.truck_id} loaded {load_amount} wood from lumber camp")
+                            log.info("Truck %s loaded %s wood from lumber camp", t.truck_id, load_amount)
                 elif t.cargo_type == "stone":
                     if src_cell == self.base_cell:
                         # Loading stone from base - always try to get 5 stone for refinery delivery
-                        print(f"=== DEBUG: Truck {t.truck_id} attempting to load stone from base ===")
-                        print(f"DEBUG: Current cell: {t.current_cell}, Base cell: {self.base_cell}")
-                        print(f"DEBUG: Source cell: {src_cell}")
-                        print(f"DEBUG: Auto-stone pickup flag: {getattr(t, 'auto_stone_pickup', False)}")
+                        log.debug("Truck %s attempting to load stone from base", t.truck_id)
+                        log.debug("Current cell: %s, Base cell: %s", t.current_cell, self.base_cell)
+                        log.debug("Source cell: %s", src_cell)
+                        log.debug("Auto-stone pickup flag: %s", t.auto_stone_pickup)
                         
                         amount_available = self.resources.get("stone", 0)
                         # For refinery delivery, always try to get 5 stone
                         target_load = 5.0
                         load_amount = min(target_load, amount_available, t.cargo_capacity - t.cargo_amount)
                         
-                        print(f"DEBUG: Stone available: {amount_available}, Target: {target_load}, Load amount: {load_amount}")
+                        log.debug("Stone available: %s, Target: %s, Load amount: %s", amount_available, target_load, load_amount)
                         
                         if load_amount > 0:
                             t.cargo_amount += load_amount
                             self.resources["stone"] = max(0, amount_available - load_amount)
-                            print(f"DEBUG: Truck {t.truck_id} loaded {load_amount} stone from base")
-                            print(f"DEBUG: Truck cargo now: {t.cargo_amount}")
-                            print(f"DEBUG: Base stone remaining: {self.resources.get('stone', 0)}")
-                            print(f"Truck {t.truck_id} loaded {load_amount} stone from base")
+                            log.debug("Truck %s loaded %s stone from base", t.truck_id, load_amount)
+                            log.debug("Truck cargo now: %s", t.cargo_amount)
+                            log.debug("Base stone remaining: %s", self.resources.get('stone', 0))
+                            log.info("Truck %s loaded %s stone from base", t.truck_id, load_amount)
                             
                             # If destination is refinery, set up refinery loop
-                            dest = getattr(t, "_dest_cell", None)
+                            dest = t._dest_cell
                             if dest is not None:
                                 dest_building = self.get_building_at_cell(dest)
                                 if dest_building and dest_building.type == "refinery":
                                     t.refinery_loop = True
                                     t.stone_delivered = load_amount  # Track how much stone was delivered
-                                    print(f"DEBUG: Truck {t.truck_id} set up for refinery stone delivery loop")
-                                    print(f"DEBUG: Stone delivered tracking: {t.stone_delivered}")
+                                    log.debug("Truck %s set up for refinery stone delivery loop", t.truck_id)
+                                    log.debug("Stone delivered tracking: %s", t.stone_delivered)
                                     
                                     # If this was auto-stone pickup, go directly to refinery
-                                    if getattr(t, 'auto_stone_pickup', False):
-                                        print(f"=== DEBUG: Auto-stone pickup detected, routing to refinery ===")
-                                        print(f"DEBUG: Truck {t.truck_id} has {load_amount} stone, going to refinery")
-                                        print(f"DEBUG: Destination: {dest}")
+                                    if t.auto_stone_pickup:
+                                        log.debug("Auto-stone pickup detected, routing to refinery")
+                                        log.debug("Truck %s has %s stone, going to refinery", t.truck_id, load_amount)
+                                        log.debug("Destination: %s", dest)
                                         
                                         # Go directly to refinery with stone
                                         cur_road = self.find_nearest_road_to_cell(t.current_cell) or t.current_cell
                                         dest_road = self.find_nearest_road_to_cell(dest)
-                                        print(f"DEBUG: Current road: {cur_road}, Destination road: {dest_road}")
+                                        log.debug("Current road: %s, Destination road: %s", cur_road, dest_road)
                                         
                                         if dest_road:
                                             path_to_refinery = self.find_path_on_roads(cur_road, dest_road)
-                                            print(f"DEBUG: Path to refinery: {path_to_refinery}")
+                                            log.debug("Path to refinery: %s", path_to_refinery)
                                             if path_to_refinery:
                                                 path_to_refinery.append(dest)
-                                                t.path_cells = path_to_refinery
+                                                t.set_path(path_to_refinery)
                                                 t.state = "to_dest"
-                                                print(f"DEBUG: Truck {t.truck_id} heading to refinery with {load_amount} stone")
-                                                print(f"DEBUG: New truck state: {t.state}")
-                                                print(f"DEBUG: Path length: {len(t.path_cells)}")
+                                                log.debug("Truck %s heading to refinery with %s stone", t.truck_id, load_amount)
+                                                log.debug("New truck state: %s", t.state)
+                                                log.debug("Path length: %s", len(t.path_cells))
                                                 return
                                             else:
-                                                print(f"ERROR: No path to refinery found for auto-stone pickup")
+                                                log.warning("No path to refinery found for auto-stone pickup")
                                                 t.state = "idle"
                                                 return
                                         else:
-                                            print(f"ERROR: No road to refinery found for auto-stone pickup")
+                                            log.warning("No road to refinery found for auto-stone pickup")
                                             t.state = "idle"
                                             return
                                     else:
-                                        print(f"DEBUG: Normal refinery route, not auto-stone pickup")
+                                        log.debug("Normal refinery route, not auto-stone pickup")
                     else:
                         # Loading from quarry
                         b = src_building
@@ -1817,11 +2077,11 @@ class Game:
                             t.cargo_amount += load_amount
                             if b and b.type == "quarry":
                                 b.storage["stone"] = max(0.0, b.storage.get("stone", 0.0) - load_amount)
-                            print(f"Truck {t.truck_id} loaded {load_amount} stone from quarry")
+                            log.info("Truck %s loaded %s stone from quarry", t.truck_id, load_amount)
                             
                             # If this is a refinery loop, go directly to refinery
-                            if hasattr(t, "refinery_loop") and t.refinery_loop:
-                                dest = getattr(t, "_dest_cell", None)
+                            if t.refinery_loop:
+                                dest = t._dest_cell
                                 if dest is not None:
                                     # Go directly to refinery with stone
                                     cur_road = self.find_nearest_road_to_cell(t.current_cell) or t.current_cell
@@ -1830,9 +2090,9 @@ class Game:
                                         path2 = self.find_path_on_roads(cur_road, dest_road)
                                         if path2:
                                             path2.append(dest)
-                                            t.path_cells = path2
+                                            t.set_path(path2)
                                             t.state = "to_dest"
-                                            print(f"Truck {t.truck_id} heading to refinery with {load_amount} stone")
+                                            log.info("Truck %s heading to refinery with %s stone", t.truck_id, load_amount)
                                             return
                 elif t.cargo_type == "bmats":
                     if src_cell == self.base_cell:
@@ -1842,7 +2102,7 @@ class Game:
                         if load_amount > 0:
                             t.cargo_amount += load_amount
                             self.resources["bmats"] = max(0, amount_available - load_amount)
-                            print(f"Truck {t.truck_id} loaded {load_amount} bmats from base")
+                            log.info("Truck %s loaded %s bmats from base", t.truck_id, load_amount)
                     else:
                         # Loading from refinery
                         b = src_building
@@ -1854,7 +2114,7 @@ class Game:
                             t.cargo_amount += load_amount
                             if b and b.type == "refinery":
                                 b.storage["bmats"] = max(0.0, b.storage.get("bmats", 0.0) - load_amount)
-                            print(f"Truck {t.truck_id} loaded {load_amount} bmats from refinery")
+                            log.info("Truck %s loaded %s bmats from refinery", t.truck_id, load_amount)
                 else:
                     # If cargo type unknown yet, infer from source building
                     if src_building:
@@ -1866,7 +2126,7 @@ class Game:
                             t.cargo_type = "bmats"
                 
                 # Now go to destination
-                dest = getattr(t, "_dest_cell", None)
+                dest = t._dest_cell
                 if dest is not None:
                     # For close buildings, route through base if needed
                     if dest == self.base_cell:
@@ -1878,7 +2138,7 @@ class Game:
                             if path2:
                                 # Add the base cell so truck can enter it
                                 path2.append(dest)
-                                t.path_cells = path2
+                                t.set_path(path2)
                                 t.state = "to_dest"
                                 return
                     else:
@@ -1890,7 +2150,7 @@ class Game:
                             if path2:
                                 # Add the destination building so truck can enter it
                                 path2.append(dest)
-                                t.path_cells = path2
+                                t.set_path(path2)
                                 t.state = "to_dest"
                                 return
             else:
@@ -1899,32 +2159,30 @@ class Game:
                 
         elif t.state == "waiting_for_bmats":
             # Truck is waiting at refinery for bmats to be produced
-            if not hasattr(t, "waiting_timer"):
-                t.waiting_timer = 0.0
             t.waiting_timer += dt
             
             # Check if we have enough bmats to collect
-            dest_cell = getattr(t, "_dest_cell", None)
+            dest_cell = t._dest_cell
             if dest_cell is not None:
                 dest_building = self.get_building_at_cell(dest_cell)
                 if dest_building and dest_building.type == "refinery":
                     bmat_available = dest_building.storage.get("bmats", 0.0)
-                    waiting_target = getattr(t, "waiting_target", 5.0)  # Default to 5 if not set
+                    waiting_target = t.waiting_target  # Default to 5 if not set
                     if bmat_available >= waiting_target:
                         # Collect the target amount of bmats and return to base
                         t.cargo_type = "bmats"
                         t.cargo_amount = waiting_target
                         dest_building.storage["bmats"] = bmat_available - waiting_target
-                        print(f"Truck {t.truck_id} collected {waiting_target} bmats from refinery")
+                        log.info("Truck %s collected %s bmats from refinery", t.truck_id, waiting_target)
                         
                         # Return to base
                         cur_road = self.find_nearest_road_to_cell(t.current_cell) or t.current_cell
-                        base_road = self.find_nearest_road_to_cell(self.base_cell)
+                        base_road = self.get_base_road()
                         if base_road:
                             path_to_base = self.find_path_on_roads(cur_road, base_road)
                             if path_to_base:
                                 path_to_base.append(self.base_cell)
-                                t.path_cells = path_to_base
+                                t.set_path(path_to_base)
                                 t.state = "to_dest"
                                 t._dest_cell = self.base_cell
                                 return
@@ -1934,7 +2192,7 @@ class Game:
                         
         elif t.state == "to_dest":
             # Check if we're at the destination (not just close to it)
-            dest_cell = getattr(t, "_dest_cell", None)
+            dest_cell = t._dest_cell
             if dest_cell is None:
                 t.state = "idle"
                 return
@@ -1948,35 +2206,35 @@ class Game:
                         delivered = int(t.cargo_amount)  # Deliver all cargo
                         self.resources[t.cargo_type] += delivered
                         t.cargo_amount = 0.0  # Clear cargo completely
-                        print(f"Truck {t.truck_id} delivered {delivered} {t.cargo_type} to base")
+                        log.info("Truck %s delivered %s %s to base", t.truck_id, delivered, t.cargo_type)
                 else:
                     # At another building, unload cargo
                     dest_building = self.get_building_at_cell(dest_cell)
                     if dest_building:
                         if t.cargo_type == "stone" and dest_building.type == "refinery" and t.cargo_amount > 0:
                             # Deliver all stone to refinery
-                            print(f"=== DEBUG: Truck {t.truck_id} delivering stone to refinery ===")
-                            print(f"DEBUG: Stone cargo amount: {t.cargo_amount}")
-                            print(f"DEBUG: Refinery current stone storage: {dest_building.storage.get('stone', 0.0)}")
-                            print(f"DEBUG: Auto-stone pickup flag: {getattr(t, 'auto_stone_pickup', False)}")
+                            log.debug("Truck %s delivering stone to refinery", t.truck_id)
+                            log.debug("Stone cargo amount: %s", t.cargo_amount)
+                            log.debug("Refinery current stone storage: %s", dest_building.storage.get('stone', 0.0))
+                            log.debug("Auto-stone pickup flag: %s", t.auto_stone_pickup)
                             
                             delivered = int(t.cargo_amount)
                             dest_building.storage["stone"] = dest_building.storage.get("stone", 0.0) + delivered
                             t.cargo_amount = 0.0  # Clear cargo completely
-                            print(f"DEBUG: Truck {t.truck_id} delivered {delivered} stone to refinery")
-                            print(f"DEBUG: Refinery stone storage now: {dest_building.storage.get('stone', 0.0)}")
+                            log.debug("Truck %s delivered %s stone to refinery", t.truck_id, delivered)
+                            log.debug("Refinery stone storage now: %s", dest_building.storage.get('stone', 0.0))
                             
                             # Now wait for bmats to be produced (wait for the amount of stone delivered)
                             if delivered > 0:
                                 t.state = "waiting_for_bmats"
                                 t.waiting_timer = 0.0
                                 t.waiting_target = delivered  # Wait for the amount of stone delivered
-                                print(f"DEBUG: Truck {t.truck_id} now waiting for {delivered} bmats at refinery")
-                                print(f"DEBUG: Truck state changed to: {t.state}")
-                                print(f"DEBUG: Waiting target set to: {t.waiting_target}")
+                                log.debug("Truck %s now waiting for %s bmats at refinery", t.truck_id, delivered)
+                                log.debug("Truck state changed to: %s", t.state)
+                                log.debug("Waiting target set to: %s", t.waiting_target)
                                 return
                             else:
-                                print(f"ERROR: No stone delivered to refinery")
+                                log.warning("No stone delivered to refinery")
                                 t.state = "idle"
                                 return
                         elif t.cargo_type in ("wood", "bmats") and t.cargo_amount > 0:
@@ -1984,12 +2242,12 @@ class Game:
                             # For now, just deliver to base instead of storage buildings
                             self.resources[t.cargo_type] += delivered
                             t.cargo_amount = 0.0  # Clear cargo completely
-                            print(f"Truck {t.truck_id} delivered {delivered} {t.cargo_type} to base")
+                            log.info("Truck %s delivered %s %s to base", t.truck_id, delivered, t.cargo_type)
             else:
                 # Not at destination yet, but check if we need to load stone for refinery delivery
-                if hasattr(t, "refinery_loop") and t.refinery_loop and t.cargo_type == "stone" and t.cargo_amount == 0:
+                if t.refinery_loop and t.cargo_type == "stone" and t.cargo_amount == 0:
                     # Truck is going to refinery but has no stone - needs to load from base first
-                    if self.is_cell_in_base_area(t.current_cell):
+                    if t.current_cell in self._base_area_cells:
                         # We're at base, load stone
                         amount_available = self.resources.get("stone", 0)
                         target_load = 5.0  # Always try to get 5 stone for refinery
@@ -1997,16 +2255,16 @@ class Game:
                         if load_amount > 0:
                             t.cargo_amount += load_amount
                             self.resources["stone"] = max(0, amount_available - load_amount)
-                            print(f"Truck {t.truck_id} loaded {load_amount} stone from base for refinery delivery")
+                            log.info("Truck %s loaded %s stone from base for refinery delivery", t.truck_id, load_amount)
                         else:
-                            print(f"Truck {t.truck_id} cannot load stone from base (available: {amount_available})")
+                            log.info("Truck %s cannot load stone from base (available: %s)", t.truck_id, amount_available)
                             t.state = "idle"
                             return
             
             # Repeat or return to idle
-            saved_src = getattr(t, "saved_source", None)
-            saved_dst = getattr(t, "saved_dest", None)
-            saved_res = getattr(t, "saved_resource", None)
+            saved_src = t.saved_source
+            saved_dst = t.saved_dest
+            saved_res = t.saved_resource
             if t.repeat_enabled and saved_src and saved_dst and saved_res:
                 # Queue next trip back to source
                 cur_road = self.find_nearest_road_to_cell(t.current_cell) or t.current_cell
@@ -2016,7 +2274,7 @@ class Game:
                     if path_back:
                         # Add the source building so truck can enter it
                         path_back.append(saved_src)
-                        t.path_cells = path_back
+                        t.set_path(path_back)
                         t.state = "to_source"
                         t.cargo_type = saved_res
                         t._dest_cell = saved_dst
@@ -2024,22 +2282,48 @@ class Game:
             # Otherwise stop
             t.state = "idle"
             t.cargo_type = None
-            if hasattr(t, "_dest_cell"):
-                delattr(t, "_dest_cell")
+            t._dest_cell = None
 
     def is_truck_at_base(self, t: Truck) -> bool:
         # Check by cell to make it robust
-        return self.is_cell_in_base_area(t.current_cell) or (
-            abs((t.position_px[0]) - (self.base_cell[0] * GRID_SIZE + GRID_SIZE // 2)) <= GRID_SIZE and
-            abs((t.position_px[1]) - (self.base_cell[1] * GRID_SIZE + GRID_SIZE // 2)) <= GRID_SIZE
+        if t.current_cell in self._base_area_cells:
+            return True
+        left, right, top, bottom = self._base_near_px
+        px, py = t.position_px
+        return left <= px <= right and top <= py <= bottom
+
+    def frame_signature(self) -> tuple:
+        # Everything the world view and HUD depend on outside of input handling.
+        # When it is unchanged and no events arrived, the previous frame is still valid.
+        hovered = self.get_hovered_building(pygame.mouse.get_pos())
+        hovered_state = None
+        if hovered is not None:
+            hovered_state = (tuple(hovered.storage.items()), hovered.conversion_timer)
+        return (
+            self.camera_x,
+            self.camera_y,
+            tuple(self.resources.values()),
+            tuple(
+                (t.position_px, t.state, t.cargo_type, t.cargo_amount, len(t.path_cells) - t.path_index, t.current_direction)
+                for t in self.trucks
+            ),
+            hovered_state,
         )
 
     def run(self) -> None:
+        last_signature = None
         while True:
             dt = self.clock.tick(FPS) / 1000.0
+            had_events = pygame.event.peek()
             self.handle_events()
             self.update(dt)
 
+            # Idle frame: nothing moved and no input, so keep what is on screen
+            signature = self.frame_signature()
+            if not had_events and signature == last_signature:
+                continue
+            last_signature = signature
+
             self.screen.fill(BG_COLOR)
             self.draw_grid()
             self.draw_roads()
@@ -2081,6 +2365,14 @@ class Game:
 
 
 if __name__ == "__main__":
+    # Buffer messages so console writes happen in occasional batches rather than
+    # mid-frame; warnings flush straight away and the rest is flushed on exit
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[logging.handlers.MemoryHandler(LOG_BUFFER_LINES, flushLevel=logging.WARNING, target=console)],
+    )
     Game().run()
 
 
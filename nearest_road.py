@@ -0,0 +1,47 @@
+"""
+Precomputed nearest-road lookup for the logistics game.
+A multi-source BFS from every road cell records, for each cell within the
+radius, the closest road and its Manhattan distance, so a lookup is one
+dict access instead of a ring scan.
+"""
+
+from collections import deque
+from typing import Deque, Dict, Iterable, Tuple
+
+Coord = Tuple[int, int]
+
+
+class NearestRoadField:
+    def __init__(self, roads: Iterable[Coord], radius: int):
+        self.radius = radius
+        # cell -> (nearest road cell, distance to it)
+        self.nearest: Dict[Coord, Tuple[Coord, int]] = {}
+        queue: Deque[Coord] = deque()
+        for road in roads:
+            self.nearest[road] = (road, 0)
+            queue.append(road)
+        self._spread(queue)
+
+    def add_road(self, road: Coord) -> None:
+        """Account for a newly placed road without rebuilding the whole field"""
+        entry = self.nearest.get(road)
+        if entry is not None and entry[1] == 0:
+            return
+        self.nearest[road] = (road, 0)
+        self._spread(deque([road]))
+
+    def _spread(self, queue: Deque[Coord]) -> None:
+        nearest = self.nearest
+        radius = self.radius
+        while queue:
+            cell = queue.popleft()
+            road, dist = nearest[cell]
+            if dist == radius:
+                continue
+            x, y = cell
+            for nb in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                current = nearest.get(nb)
+                # Cells that already have a road at least as close cannot pass a better one on
+                if current is None or current[1] > dist + 1:
+                    nearest[nb] = (road, dist + 1)
+                    queue.append(nb)
@@ -0,0 +1,77 @@
+"""
+Breadth-first route search over the road grid for the logistics game.
+Kept free of game objects and fully annotated so it can be compiled with mypyc.
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+Coord = Tuple[int, int]
+
+
+def bfs_path(road_grid: Set[Coord], start: Coord, goal: Coord) -> List[Coord]:
+    """Shortest 4-connected route from start to goal through road_grid; [] if unreachable
+
+    Only the start may lie off the road grid. Searches from both ends and
+    always grows the smaller frontier, so each side covers about half the distance.
+    """
+    if start == goal:
+        return [start]
+    if goal not in road_grid:
+        return []
+    came_s: Dict[Coord, Optional[Coord]] = {start: None}
+    came_g: Dict[Coord, Optional[Coord]] = {goal: None}
+    frontier_s: List[Coord] = [start]
+    frontier_g: List[Coord] = [goal]
+    meets: List[Coord] = []
+    while frontier_s and frontier_g and not meets:
+        if len(frontier_s) <= len(frontier_g):
+            frontier_s = _expand_layer(frontier_s, came_s, came_g, road_grid, goal, meets)
+            other = came_g
+        else:
+            frontier_g = _expand_layer(frontier_g, came_g, came_s, road_grid, start, meets)
+            other = came_s
+    if not meets:
+        return []
+    # Every meeting cell in the layer is equally far from the expanding side,
+    # so the shortest route uses the one closest to the other end
+    meet = min(meets, key=lambda cell: _chain_length(other, cell))
+    # reconstruct: start -> meet from one tree, then meet -> goal from the other
+    path: List[Coord] = []
+    node: Optional[Coord] = meet
+    while node is not None:
+        path.append(node)
+        node = came_s[node]
+    path.reverse()
+    node = came_g[meet]
+    while node is not None:
+        path.append(node)
+        node = came_g[node]
+    return path
+
+
+def _expand_layer(frontier: List[Coord], came: Dict[Coord, Optional[Coord]],
+                  other_came: Dict[Coord, Optional[Coord]], road_grid: Set[Coord],
+                  far_end: Coord, meets: List[Coord]) -> List[Coord]:
+    """Grow one side by a full BFS layer, collecting cells the other side has already reached"""
+    next_frontier: List[Coord] = []
+    for cur in frontier:
+        x, y = cur
+        for nb in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            # Only move to driveable road cells (or onto the other search's origin)
+            if nb in came or (nb not in road_grid and nb != far_end):
+                continue
+            came[nb] = cur
+            next_frontier.append(nb)
+            if nb in other_came:
+                meets.append(nb)
+    return next_frontier
+
+
+def _chain_length(came: Dict[Coord, Optional[Coord]], cell: Coord) -> int:
+    """Number of steps from cell back to the root of its search tree"""
+    steps = 0
+    node = came[cell]
+    while node is not None:
+        steps += 1
+        node = came[node]
+    return steps
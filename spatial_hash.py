@@ -0,0 +1,73 @@
+"""
+Spatial hash for grid cells in the logistics game.
+Buckets cells into coarse blocks so radius queries only touch nearby cells.
+"""
+
+from array import array
+from typing import Dict, Tuple
+
+Coord = Tuple[int, int]
+
+
+class SpatialHash:
+    def __init__(self, bucket_size: int = 8):
+        self.bucket_size = bucket_size
+        # Each bucket stores its cells as parallel x / y int arrays
+        self.buckets: Dict[Coord, Tuple[array, array]] = {}
+
+    def insert(self, cell: Coord) -> None:
+        """Add a cell to its bucket"""
+        b = self.bucket_size
+        key = (cell[0] // b, cell[1] // b)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = (array('i'), array('i'))
+        bucket[0].append(cell[0])
+        bucket[1].append(cell[1])
+
+    def remove(self, cell: Coord) -> None:
+        """Remove a cell from its bucket if present"""
+        b = self.bucket_size
+        key = (cell[0] // b, cell[1] // b)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            return
+        xs, ys = bucket
+        for i in range(len(xs)):
+            if xs[i] == cell[0] and ys[i] == cell[1]:
+                del xs[i]
+                del ys[i]
+                break
+        if not xs:
+            del self.buckets[key]
+
+    def count_in_radius(self, center_cell: Coord, radius_cells: int) -> int:
+        """Count cells within radius_cells of center_cell (Euclidean, inclusive)"""
+        rc2 = radius_cells * radius_cells
+        cx, cy = center_cell
+        b = self.bucket_size
+        count = 0
+        for bx in range((cx - radius_cells) // b, (cx + radius_cells) // b + 1):
+            # Offsets from the center to this bucket column's nearest and farthest x
+            near_x = min(max(cx, bx * b), bx * b + b - 1) - cx
+            far_x = max(cx - bx * b, bx * b + b - 1 - cx)
+            for by in range((cy - radius_cells) // b, (cy + radius_cells) // b + 1):
+                bucket = self.buckets.get((bx, by))
+                if bucket is None:
+                    continue
+                near_y = min(max(cy, by * b), by * b + b - 1) - cy
+                if near_x * near_x + near_y * near_y > rc2:
+                    # Bucket lies entirely outside the disk
+                    continue
+                xs, ys = bucket
+                far_y = max(cy - by * b, by * b + b - 1 - cy)
+                if far_x * far_x + far_y * far_y <= rc2:
+                    # Bucket lies entirely inside the disk
+                    count += len(xs)
+                    continue
+                for i in range(len(xs)):
+                    dx = xs[i] - cx
+                    dy = ys[i] - cy
+                    if dx * dx + dy * dy <= rc2:
+                        count += 1
+        return count
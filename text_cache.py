@@ -0,0 +1,46 @@
+"""
+Cached text rendering for the logistics game.
+UI labels are mostly the same strings frame after frame, so rendered
+surfaces are reused instead of being rasterised again every frame.
+"""
+
+import pygame
+from typing import Dict, Optional, Tuple
+
+TextKey = Tuple[str, bool, Tuple[int, ...], Optional[Tuple[int, ...]]]
+
+
+class CachedFont(pygame.font.Font):
+    """pygame Font whose render() results are memoized per (text, antialias, color, background)"""
+
+    def __init__(self, path: Optional[str], size: int, max_entries: int = 512):
+        super().__init__(path, size)
+        self.max_entries = max_entries
+        self._cache: Dict[TextKey, pygame.Surface] = {}
+
+    def render(self, text, antialias, color, background=None) -> pygame.Surface:
+        if background is None and type(color) is tuple:
+            # Common case for the game's UI: plain RGB tuples, no background
+            key: TextKey = (text, antialias, color, None)
+        else:
+            key = (str(text), bool(antialias), tuple(color), None if background is None else tuple(background))
+        surface = self._cache.get(key)
+        if surface is None:
+            # Counters produce new strings over time; start over rather than grow unbounded
+            if len(self._cache) >= self.max_entries:
+                self._cache.clear()
+            surface = super().render(text, antialias, color, background)
+            self._cache[key] = surface
+        return surface
+
+
+def _cached_font_constructor(path: Optional[str], size: int, bold: bool, italic: bool) -> CachedFont:
+    font = CachedFont(path, size)
+    font.set_bold(bold)
+    font.set_italic(italic)
+    return font
+
+
+def cached_sys_font(name: str, size: int, bold: bool = False, italic: bool = False) -> CachedFont:
+    """Same lookup as pygame.font.SysFont, returning a CachedFont"""
+    return pygame.font.SysFont(name, size, bold, italic, constructor=_cached_font_constructor)
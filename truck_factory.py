@@ -4,7 +4,7 @@ Handles building new trucks with increasing costs.
 """
 
 import pygame
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 
 # Colors for truck factory button
 TRUCK_BUTTON_BG = (60, 120, 60)
@@ -15,6 +15,12 @@ class TruckFactory:
     def __init__(self):
         self.trucks_built = 0
         self.button_rect: Optional[pygame.Rect] = None
+        # Base rect (x, y, w, h) that button_rect was laid out against
+        self._button_base: Optional[Tuple[int, int, int, int]] = None
+        # Rendered "+" per affordability, and the cost label with the (trucks_built, can_afford) it shows
+        self._plus_surfs: Dict[bool, pygame.Surface] = {}
+        self._cost_surf: Optional[pygame.Surface] = None
+        self._cost_key: Optional[Tuple[int, bool]] = None
         
     def get_truck_cost(self) -> int:
         """Calculate cost for next truck: 10 + (15 * trucks_built)"""
@@ -32,8 +38,10 @@ class TruckFactory:
     def draw_button(self, screen: pygame.Surface, font: pygame.font.Font, base_rect: pygame.Rect, 
                    bmats: int, can_afford: bool) -> None:
         """Draw the truck building button on the base"""
-        if self.button_rect is None:
+        base = (base_rect.x, base_rect.y, base_rect.width, base_rect.height)
+        if self.button_rect is None or base != self._button_base:
             self.get_button_rect(base_rect)
+            self._button_base = base
             
         # Determine button color based on affordability
         if can_afford:
@@ -48,14 +56,20 @@ class TruckFactory:
         pygame.draw.rect(screen, border_color, self.button_rect, 2, border_radius=4)
         
         # Draw + symbol
-        plus_color = (255, 255, 255) if can_afford else (150, 150, 150)
-        plus_surf = font.render("+", True, plus_color)
+        text_color = (255, 255, 255) if can_afford else (150, 150, 150)
+        plus_surf = self._plus_surfs.get(can_afford)
+        if plus_surf is None:
+            plus_surf = font.render("+", True, text_color)
+            self._plus_surfs[can_afford] = plus_surf
         plus_rect = plus_surf.get_rect(center=self.button_rect.center)
         screen.blit(plus_surf, plus_rect)
         
-        # Draw cost below the button
-        cost_text = f"{self.get_truck_cost()}"
-        cost_surf = font.render(cost_text, True, (255, 255, 255) if can_afford else (150, 150, 150))
+        # Draw cost below the button; it only changes when a truck is built
+        cost_key = (self.trucks_built, can_afford)
+        if self._cost_surf is None or cost_key != self._cost_key:
+            self._cost_surf = font.render(f"{self.get_truck_cost()}", True, text_color)
+            self._cost_key = cost_key
+        cost_surf = self._cost_surf
         cost_x = self.button_rect.centerx - cost_surf.get_width() // 2
         cost_y = self.button_rect.bottom + 2
         screen.blit(cost_surf, (cost_x, cost_y))
@@ -69,3 +83,4 @@ class TruckFactory:
     def build_truck(self) -> None:
         """Increment truck count after building"""
         self.trucks_built += 1
+        self._cost_surf = None
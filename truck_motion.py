@@ -0,0 +1,74 @@
+"""
+Per-frame truck movement for the logistics game.
+Kept free of game objects and fully annotated so it can be compiled with mypyc.
+"""
+
+import math
+from typing import Tuple
+
+Point = Tuple[float, float]
+
+# Closer than this to a cell center counts as having reached it
+ARRIVAL_EPSILON = 1e-3
+# Headings closer than 0.3 rad to an axis snap onto it
+AXIS_SNAP_COS = math.cos(0.3)
+# Below this angle (~11 degrees) heading smoothing interpolates vectors instead of angles
+SMALL_TURN_COS = 0.98
+
+
+def segment_towards(pos: Point, target: Point) -> Tuple[float, float, float]:
+    """Unit direction (x, y) from pos to target and the distance between them"""
+    vx = target[0] - pos[0]
+    vy = target[1] - pos[1]
+    # Paths step between 4-neighbour cell centers, so movement is almost always
+    # along one axis and the distance is exact without a square root
+    if vy == 0.0:
+        dist = abs(vx)
+    elif vx == 0.0:
+        dist = abs(vy)
+    else:
+        dist = math.hypot(vx, vy)
+    if dist < ARRIVAL_EPSILON:
+        return (0.0, 0.0, dist)
+    return (vx / dist, vy / dist, dist)
+
+
+def unit_towards(pos: Point, target: Point) -> Point:
+    """Unit vector from pos towards target, or (0.0, 0.0) when they coincide"""
+    dx = target[0] - pos[0]
+    dy = target[1] - pos[1]
+    # One reciprocal and two multiplies rather than two divides
+    length_sq = dx * dx + dy * dy
+    if length_sq > 0.0:
+        inv_length = 1.0 / math.sqrt(length_sq)
+        return (dx * inv_length, dy * inv_length)
+    return (0.0, 0.0)
+
+
+def turn_towards(current: Point, ideal: Point, smoothing_factor: float) -> Point:
+    """Turn the unit heading current by smoothing_factor of its angle to the unit heading ideal"""
+    cx, cy = current
+    ix, iy = ideal
+    cos_t = cx * ix + cy * iy
+    if cos_t > SMALL_TURN_COS:
+        # Nearly aligned: interpolating the vectors matches the angle step closely
+        smooth_x = cx + (ix - cx) * smoothing_factor
+        smooth_y = cy + (iy - cy) * smoothing_factor
+        length = math.sqrt(smooth_x * smooth_x + smooth_y * smooth_y)
+        return (smooth_x / length, smooth_y / length)
+    # Wider turns (a few frames per corner) rotate by the exact fraction of the angle
+    turn = math.atan2(cx * iy - cy * ix, cos_t) * smoothing_factor
+    cos_turn = math.cos(turn)
+    sin_turn = math.sin(turn)
+    return (cx * cos_turn - cy * sin_turn, cx * sin_turn + cy * cos_turn)
+
+
+def snap_to_axis(heading: Point) -> Point:
+    """Exact axis vector for a unit heading within 0.3 rad of an axis, else the heading itself"""
+    # Within 0.3 rad of an axis the dominant component exceeds cos(0.3)
+    hx, hy = heading
+    if abs(hx) >= AXIS_SNAP_COS:
+        return (1.0 if hx > 0.0 else -1.0, 0.0)
+    if abs(hy) >= AXIS_SNAP_COS:
+        return (0.0, 1.0 if hy > 0.0 else -1.0)
+    return heading
@@ -4,7 +4,7 @@ Handles keyboard number selection and detailed truck info display.
 """
 
 import pygame
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
 
 # Colors for truck selection UI
@@ -15,8 +15,14 @@ TRUCK_STATUS_IDLE = (120, 120, 120)
 TRUCK_STATUS_MOVING = (60, 200, 60)
 TRUCK_STATUS_LOADING = (200, 200, 60)
 TRUCK_STATUS_UNLOADING = (200, 120, 60)
+# Panel status color per truck state; states not listed show as moving
+STATUS_COLORS = {
+    "idle": TRUCK_STATUS_IDLE,
+    "to_source": TRUCK_STATUS_MOVING,
+    "to_dest": TRUCK_STATUS_MOVING,
+}
 
-@dataclass
+@dataclass(slots=True)
 class TruckInfo:
     """Information about a truck's current status"""
     truck_id: int
@@ -31,6 +37,14 @@ class TruckSelector:
     def __init__(self):
         self.selected_truck_id: Optional[int] = None
         self.truck_info_panel_rect: Optional[pygame.Rect] = None
+        self.reset_button_rect: Optional[pygame.Rect] = None
+        # Screen size the panel and reset button were laid out for
+        self._panel_screen: Optional[Tuple[int, int]] = None
+        # Pre-rendered info panel with its screen position, and the displayed values it shows
+        self._panel_surface: Optional[Tuple[pygame.Surface, Tuple[int, int]]] = None
+        self._panel_key: Optional[tuple] = None
+        # Number badges with their offsets, keyed on (font, number, selected)
+        self._number_badges: Dict[tuple, Tuple[pygame.Surface, Tuple[int, int]]] = {}
         
     def select_truck_by_number(self, number: int, trucks: List) -> Optional[int]:
         """Select truck by number key (1-9)"""
@@ -47,41 +61,55 @@ class TruckSelector:
         x = screen_width - panel_width - margin
         y = margin
         self.truck_info_panel_rect = pygame.Rect(x, y, panel_width, panel_height)
+        self.reset_button_rect = pygame.Rect(x + 15, y + 190, 80, 25)
         return self.truck_info_panel_rect
         
     def draw_truck_info_panel(self, screen: pygame.Surface, font: pygame.font.Font, 
                              selected_truck, trucks: List) -> None:
         """Draw the truck info panel"""
-        if self.truck_info_panel_rect is None:
-            self.get_truck_info_panel_rect(screen.get_width(), screen.get_height())
+        screen_size = screen.get_size()
+        if self.truck_info_panel_rect is None or screen_size != self._panel_screen:
+            self.get_truck_info_panel_rect(*screen_size)
+            self._panel_screen = screen_size
             
         if selected_truck is None:
             return
             
-        # Draw panel background
-        pygame.draw.rect(screen, TRUCK_INFO_BG, self.truck_info_panel_rect, border_radius=8)
-        pygame.draw.rect(screen, TRUCK_INFO_BORDER, self.truck_info_panel_rect, 2, border_radius=8)
+        # The panel only changes with what it shows, so it is kept pre-rendered
+        # and redrawn off-screen when any displayed field changes
+        key = (font, self.truck_info_panel_rect.topleft, selected_truck.truck_id, selected_truck.state,
+               selected_truck.cargo_type, selected_truck.cargo_amount,
+               len(selected_truck.path_cells) - selected_truck.path_index if selected_truck.path_cells else 0,
+               self._is_going_to_base(selected_truck))
+        if self._panel_surface is None or key != self._panel_key:
+            self._panel_surface = self._render_truck_info_panel(font, selected_truck)
+            self._panel_key = key
+        surface, pos = self._panel_surface
+        screen.blit(surface, pos)
+        
+    def _render_truck_info_panel(self, font: pygame.font.Font,
+                                 selected_truck) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Draw the panel for selected_truck onto its own surface; returns it with its screen position"""
+        panel = self.truck_info_panel_rect
+        reset_btn_rect = self.reset_button_rect
+        text_x = panel.x + 15
         
         # Panel title
         title = font.render(f"TRUCK {selected_truck.truck_id}", True, (255, 255, 255))
-        title_rect = title.get_rect(midtop=(self.truck_info_panel_rect.centerx, self.truck_info_panel_rect.y + 10))
-        screen.blit(title, title_rect)
+        blit_list = [(title, title.get_rect(midtop=(panel.centerx, panel.y + 10)))]
         
         # Truck status
         status_color = self._get_status_color(selected_truck.state)
         status_text = f"Status: {selected_truck.state.upper()}"
-        status_surf = font.render(status_text, True, status_color)
-        screen.blit(status_surf, (self.truck_info_panel_rect.x + 15, self.truck_info_panel_rect.y + 40))
+        blit_list.append((font.render(status_text, True, status_color), (text_x, panel.y + 40)))
         
         # Cargo information
         if selected_truck.cargo_type:
             cargo_text = f"Cargo: {selected_truck.cargo_type.upper()} ({selected_truck.cargo_amount:.1f})"
             cargo_surf = font.render(cargo_text, True, (255, 255, 255))
-            screen.blit(cargo_surf, (self.truck_info_panel_rect.x + 15, self.truck_info_panel_rect.y + 65))
         else:
-            cargo_text = "Cargo: Empty"
-            cargo_surf = font.render(cargo_text, True, (150, 150, 150))
-            screen.blit(cargo_surf, (self.truck_info_panel_rect.x + 15, self.truck_info_panel_rect.y + 65))
+            cargo_surf = font.render("Cargo: Empty", True, (150, 150, 150))
+        blit_list.append((cargo_surf, (text_x, panel.y + 65)))
         
         # Destination information
         if selected_truck.path_cells:
@@ -91,43 +119,42 @@ class TruckSelector:
             else:
                 dest_text = "Destination: Resource Facility"
                 dest_color = (200, 200, 60)  # Yellow for resource
-            dest_surf = font.render(dest_text, True, dest_color)
-            screen.blit(dest_surf, (self.truck_info_panel_rect.x + 15, self.truck_info_panel_rect.y + 90))
+            blit_list.append((font.render(dest_text, True, dest_color), (text_x, panel.y + 90)))
             
             # Path length
-            path_text = f"Path Length: {len(selected_truck.path_cells)} cells"
-            path_surf = font.render(path_text, True, (200, 200, 200))
-            screen.blit(path_surf, (self.truck_info_panel_rect.x + 15, self.truck_info_panel_rect.y + 115))
+            path_text = f"Path Length: {len(selected_truck.path_cells) - selected_truck.path_index} cells"
+            blit_list.append((font.render(path_text, True, (200, 200, 200)), (text_x, panel.y + 115)))
         else:
-            dest_text = "Destination: None (Idle)"
-            dest_surf = font.render(dest_text, True, (150, 150, 150))
-            screen.blit(dest_surf, (self.truck_info_panel_rect.x + 15, self.truck_info_panel_rect.y + 90))
+            blit_list.append((font.render("Destination: None (Idle)", True, (150, 150, 150)), (text_x, panel.y + 90)))
         
         # Resource preview (if going to base)
         if selected_truck.cargo_type and selected_truck.cargo_amount > 0 and self._is_going_to_base(selected_truck):
             resource_text = f"→ Will deliver {selected_truck.cargo_amount:.1f} {selected_truck.cargo_type.upper()}"
-            resource_surf = font.render(resource_text, True, (60, 200, 60))
-            screen.blit(resource_surf, (self.truck_info_panel_rect.x + 15, self.truck_info_panel_rect.y + 140))
+            blit_list.append((font.render(resource_text, True, (60, 200, 60)), (text_x, panel.y + 140)))
         
         # Keyboard shortcuts hint
-        hint_text = "Press 1-9 to select trucks"
-        hint_surf = font.render(hint_text, True, (150, 150, 150))
-        screen.blit(hint_surf, (self.truck_info_panel_rect.x + 15, self.truck_info_panel_rect.y + 170))
-        
-        # Reset button
-        reset_btn_rect = pygame.Rect(self.truck_info_panel_rect.x + 15, self.truck_info_panel_rect.y + 190, 80, 25)
-        pygame.draw.rect(screen, (200, 80, 80), reset_btn_rect, border_radius=4)
-        pygame.draw.rect(screen, (150, 60, 60), reset_btn_rect, 2, border_radius=4)
+        blit_list.append((font.render("Press 1-9 to select trucks", True, (150, 150, 150)), (text_x, panel.y + 170)))
+        
+        # Reset button label
         reset_text = font.render("RESET", True, (255, 255, 255))
-        reset_rect = reset_text.get_rect(center=reset_btn_rect.center)
-        screen.blit(reset_text, reset_rect)
+        blit_list.append((reset_text, reset_text.get_rect(center=reset_btn_rect.center)))
         
-        # Store the reset button rect for click detection
-        self.reset_button_rect = reset_btn_rect
+        # Size the surface to everything drawn, in case a long label runs past the panel
+        bounds = panel.unionall([reset_btn_rect] + [pygame.Rect(dest[:2], surf.get_size()) for surf, dest in blit_list])
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        ox, oy = -bounds.x, -bounds.y
+        # Panel background and the reset button go first; the text never overlaps
+        # the button, so every label can then go out in a single blits() call
+        pygame.draw.rect(surface, TRUCK_INFO_BG, panel.move(ox, oy), border_radius=8)
+        pygame.draw.rect(surface, TRUCK_INFO_BORDER, panel.move(ox, oy), 2, border_radius=8)
+        pygame.draw.rect(surface, (200, 80, 80), reset_btn_rect.move(ox, oy), border_radius=4)
+        pygame.draw.rect(surface, (150, 60, 60), reset_btn_rect.move(ox, oy), 2, border_radius=4)
+        surface.blits([(surf, (dest[0] + ox, dest[1] + oy)) for surf, dest in blit_list], doreturn=False)
+        return surface, bounds.topleft
         
     def handle_reset_click(self, pos: tuple) -> bool:
         """Handle click on reset button, return True if clicked"""
-        if hasattr(self, 'reset_button_rect') and self.reset_button_rect.collidepoint(pos):
+        if self.reset_button_rect is not None and self.reset_button_rect.collidepoint(pos):
             return True
         return False
         
@@ -135,60 +162,79 @@ class TruckSelector:
         """Reset truck to idle state"""
         if truck:
             truck.state = "idle"
-            truck.path_cells.clear()
+            truck.set_path([])
             truck.cargo_type = None
             truck.cargo_amount = 0.0
             # Clear any saved assignment data
             truck.saved_source = None
             truck.saved_dest = None
             truck.saved_resource = None
-            if hasattr(truck, '_dest_cell'):
-                delattr(truck, '_dest_cell')
+            truck._dest_cell = None
             
     def _get_status_color(self, state: str) -> tuple:
         """Get color for truck status"""
-        if state == "idle":
-            return TRUCK_STATUS_IDLE
-        elif state == "to_source":
-            return TRUCK_STATUS_MOVING
-        elif state == "to_dest":
-            return TRUCK_STATUS_MOVING
-        else:
-            return TRUCK_STATUS_MOVING
+        return STATUS_COLORS.get(state, TRUCK_STATUS_MOVING)
             
     def _is_going_to_base(self, truck) -> bool:
         """Check if truck is heading to the main base"""
         # This will need to be implemented based on your game's logic
         # For now, we'll assume if there's a destination and it's not "to_source", it's going to base
-        return truck.state == "to_dest" and hasattr(truck, "_dest_cell")
+        return truck.state == "to_dest" and truck._dest_cell is not None
         
     def draw_truck_numbers(self, screen: pygame.Surface, font: pygame.font.Font, 
                           trucks: List, camera_x: int, camera_y: int) -> None:
         """Draw truck numbers above each truck for easy identification"""
-        for i, truck in enumerate(trucks, 1):
-            if i <= 9:  # Only show numbers 1-9
-                # Only show numbers for deployed trucks (not idle or have a path)
-                if truck.state == "idle" and not truck.path_cells:
-                    continue
-                    
-                x = truck.position_px[0] - camera_x
-                y = truck.position_px[1] - camera_y - 30  # Above the truck
-                
-                # Draw number background
-                number_text = str(i)
-                number_surf = font.render(number_text, True, (255, 255, 255))
-                number_rect = number_surf.get_rect(center=(x, y))
-                
-                # Highlight selected truck
-                if truck.truck_id == self.selected_truck_id:
-                    # Draw selection indicator
-                    pygame.draw.circle(screen, SELECTED_TRUCK_BG, (int(x), int(y)), 12)
-                    pygame.draw.circle(screen, (255, 255, 255), (int(x), int(y)), 12, 2)
-                else:
-                    # Draw regular number background
-                    pygame.draw.circle(screen, (80, 80, 80), (int(x), int(y)), 10)
-                    pygame.draw.circle(screen, (120, 120, 120), (int(x), int(y)), 10, 1)
+        blit_list = []
+        # Badges reach 12px from their center and the number sits up and left of it,
+        # so anything further than this outside the screen cannot show
+        margin = 24
+        max_x = screen.get_width() + margin
+        max_y = screen.get_height() + margin
+        # Only the first nine trucks have number keys, so later ones never get a badge
+        for i, truck in enumerate(trucks[:9], 1):
+            # Only show numbers for deployed trucks (not idle or have a path)
+            if truck.state == "idle" and not truck.path_cells:
+                continue
                 
-                # Draw the number
-                screen.blit(number_surf, (number_rect.x - number_surf.get_width() // 2, 
-                                        number_rect.y - number_surf.get_height() // 2))
+            x = round(truck.position_px[0] - camera_x)
+            y = round(truck.position_px[1] - camera_y) - 30  # Above the truck
+            if x < -margin or x > max_x or y < -margin or y > max_y:
+                continue
+            
+            # Number on its background, with the selected truck getting the larger badge
+            badge, (dx, dy) = self._get_number_badge(font, i, truck.truck_id == self.selected_truck_id)
+            blit_list.append((badge, (x + dx, y + dy)))
+        screen.blits(blit_list, doreturn=False)
+        
+    def _get_number_badge(self, font: pygame.font.Font, number: int,
+                          selected: bool) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Truck number drawn over its circle, rendered once per (number, selected)
+
+        Returns the surface and its offset from the badge center.
+        """
+        key = (font, number, selected)
+        badge = self._number_badges.get(key)
+        if badge is None:
+            radius = 12 if selected else 10
+            number_surf = font.render(str(number), True, (255, 255, 255))
+            w, h = number_surf.get_size()
+            # The number has always been drawn up and to the left of the circle center
+            text_x = -(w // 2) * 2
+            text_y = -(h // 2) * 2
+            left = min(-radius, text_x)
+            top = min(-radius, text_y)
+            right = max(radius + 1, text_x + w)
+            bottom = max(radius + 1, text_y + h)
+            surface = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+            center = (-left, -top)
+            if selected:
+                # Selection indicator
+                pygame.draw.circle(surface, SELECTED_TRUCK_BG, center, radius)
+                pygame.draw.circle(surface, (255, 255, 255), center, radius, 2)
+            else:
+                pygame.draw.circle(surface, (80, 80, 80), center, radius)
+                pygame.draw.circle(surface, (120, 120, 120), center, radius, 1)
+            surface.blit(number_surf, (text_x - left, text_y - top))
+            badge = (surface, (left, top))
+            self._number_badges[key] = badge
+        return badge
@@ -5,7 +5,18 @@ Handles truck sprite rotation based on movement direction.
 
 import pygame
 import math
-from typing import Tuple, Optional, List
+from typing import Dict, Tuple, Optional, List
+
+from truck_motion import snap_to_axis, turn_towards, unit_towards
+
+# Cell size in pixels (must match GRID_SIZE in main.py) and the offset to a cell's center
+CELL_SIZE = 32
+HALF_CELL = CELL_SIZE // 2
+
+# Loaded (and scaled) truck images and their rotations by (width, height),
+# shared by every TruckSprite of that size
+_BASE_SPRITES: Dict[Tuple[int, int], pygame.Surface] = {}
+_ROTATED_SPRITES: Dict[Tuple[int, int], Dict[int, pygame.Surface]] = {}
 
 class TruckSprite:
     def __init__(self, width: int = 36, height: int = 24):
@@ -13,9 +24,19 @@ class TruckSprite:
         self.width = width
         self.height = height
         self.sprite_surface = self._create_truck_sprite()
+        # Rotated copies of the sprite by whole-degree angle, filled as headings come up
+        self._rotation_cache = _ROTATED_SPRITES.setdefault((width, height), {})
         
     def _create_truck_sprite(self) -> pygame.Surface:
-        """Load the real truck sprite image"""
+        """Load the real truck sprite image, reading the file only once per size"""
+        size = (self.width, self.height)
+        sprite = _BASE_SPRITES.get(size)
+        if sprite is None:
+            sprite = self._load_truck_sprite()
+            _BASE_SPRITES[size] = sprite
+        return sprite
+    
+    def _load_truck_sprite(self) -> pygame.Surface:
         try:
             # Load the truck image from the LogisticsGame folder
             image_path = "LogisticsGame/Truck.png"
@@ -56,17 +77,20 @@ class TruckSprite:
         
     def get_rotated_sprite(self, direction: Tuple[float, float]) -> pygame.Surface:
         """Get truck sprite rotated to face the movement direction"""
-        if direction == (0, 0):
+        if not direction[0] and not direction[1]:
             # No movement, return original sprite (facing right)
             return self.sprite_surface
             
         # Calculate angle from direction vector
         # Note: pygame's rotate uses clockwise rotation, and 0 degrees is right
         # We need to convert our direction vector to the correct angle
-        angle = math.degrees(math.atan2(-direction[1], direction[0]))
+        angle = round(math.degrees(math.atan2(-direction[1], direction[0]))) % 360
         
-        # Rotate the sprite
-        rotated = pygame.transform.rotate(self.sprite_surface, angle)
+        # Rotate the sprite once per whole-degree heading and reuse it afterwards
+        rotated = self._rotation_cache.get(angle)
+        if rotated is None:
+            rotated = pygame.transform.rotate(self.sprite_surface, angle)
+            self._rotation_cache[angle] = rotated
         
         return rotated
         
@@ -77,8 +101,8 @@ class TruckSprite:
         sprite = self.get_rotated_sprite(direction)
         
         # Calculate screen position
-        screen_x = int(position[0] - camera_x - sprite.get_width() // 2)
-        screen_y = int(position[1] - camera_y - sprite.get_height() // 2)
+        screen_x = round(position[0] - camera_x) - sprite.get_width() // 2
+        screen_y = round(position[1] - camera_y) - sprite.get_height() // 2
         
         # Draw the sprite
         screen.blit(sprite, (screen_x, screen_y))
@@ -86,14 +110,7 @@ class TruckSprite:
     def get_truck_direction(self, current_pos: Tuple[float, float], 
                            target_pos: Tuple[float, float]) -> Tuple[float, float]:
         """Calculate direction vector from current to target position"""
-        dx = target_pos[0] - current_pos[0]
-        dy = target_pos[1] - current_pos[1]
-        
-        # Normalize the direction vector
-        length = math.sqrt(dx * dx + dy * dy)
-        if length > 0:
-            return (dx / length, dy / length)
-        return (0, 0)
+        return unit_towards(current_pos, target_pos)
     
     def get_smooth_direction(self, current_pos: Tuple[float, float], 
                             target_pos: Tuple[float, float], 
@@ -104,7 +121,7 @@ class TruckSprite:
         ideal_direction = self.get_truck_direction(current_pos, target_pos)
         
         # If no ideal direction (stationary), keep current direction
-        if ideal_direction == (0, 0):
+        if not ideal_direction[0] and not ideal_direction[1]:
             return current_direction
         
         # Interpolate between current and ideal direction
@@ -112,9 +129,10 @@ class TruckSprite:
         smooth_y = current_direction[1] + (ideal_direction[1] - current_direction[1]) * smoothing_factor
         
         # Normalize the smoothed direction
-        length = math.sqrt(smooth_x * smooth_x + smooth_y * smooth_y)
-        if length > 0:
-            return (smooth_x / length, smooth_y / length)
+        length_sq = smooth_x * smooth_x + smooth_y * smooth_y
+        if length_sq > 0:
+            inv_length = 1.0 / math.sqrt(length_sq)
+            return (smooth_x * inv_length, smooth_y * inv_length)
         return ideal_direction
     
     def get_path_based_direction(self, current_pos: Tuple[float, float], 
@@ -128,33 +146,18 @@ class TruckSprite:
         # Get the next cell in the path
         next_cell = path_cells[0]
         target_pos = (
-            next_cell[0] * 32 + 16,  # Assuming GRID_SIZE = 32
-            next_cell[1] * 32 + 16
+            float(next_cell[0] * CELL_SIZE + HALF_CELL),
+            float(next_cell[1] * CELL_SIZE + HALF_CELL)
         )
         
         # Calculate ideal direction to next cell
         ideal_direction = self.get_truck_direction(current_pos, target_pos)
         
         # If no ideal direction, keep current
-        if ideal_direction == (0, 0):
+        if not ideal_direction[0] and not ideal_direction[1]:
             return current_direction
         
-        # Calculate the angle difference between current and ideal direction
-        current_angle = math.atan2(current_direction[1], current_direction[0])
-        ideal_angle = math.atan2(ideal_direction[1], ideal_direction[0])
-        
-        # Handle angle wrapping (e.g., -180 to 180 degrees)
-        angle_diff = ideal_angle - current_angle
-        if angle_diff > math.pi:
-            angle_diff -= 2 * math.pi
-        elif angle_diff < -math.pi:
-            angle_diff += 2 * math.pi
-        
-        # Apply smoothing to the angle change
-        smoothed_angle = current_angle + angle_diff * smoothing_factor
-        
-        # Convert back to direction vector
-        return (math.cos(smoothed_angle), math.sin(smoothed_angle))
+        return turn_towards(current_direction, ideal_direction, smoothing_factor)
     
     def get_grid_aligned_direction(self, current_pos: Tuple[float, float], 
                                   path_cells: List, 
@@ -163,43 +166,25 @@ class TruckSprite:
         """Calculate direction with perfect grid alignment for 90-degree rotations"""
         if not path_cells:
             return current_direction
-            
-        # Get the next cell in the path
-        next_cell = path_cells[0]
+        return self.get_grid_aligned_direction_to_cell(current_pos, path_cells[0], current_direction, smoothing_factor)
+    
+    def get_grid_aligned_direction_to_cell(self, current_pos: Tuple[float, float],
+                                           next_cell: Tuple[int, int],
+                                           current_direction: Tuple[float, float],
+                                           smoothing_factor: float = 0.2) -> Tuple[float, float]:
+        """Grid-aligned direction towards the center of next_cell, without needing a path list"""
         target_pos = (
-            next_cell[0] * 32 + 16,  # Assuming GRID_SIZE = 32
-            next_cell[1] * 32 + 16
+            float(next_cell[0] * CELL_SIZE + HALF_CELL),
+            float(next_cell[1] * CELL_SIZE + HALF_CELL)
         )
         
         # Calculate ideal direction to next cell
         ideal_direction = self.get_truck_direction(current_pos, target_pos)
         
         # If no ideal direction, keep current
-        if ideal_direction == (0, 0):
+        if not ideal_direction[0] and not ideal_direction[1]:
             return current_direction
         
-        # Calculate the angle difference between current and ideal direction
-        current_angle = math.atan2(current_direction[1], current_direction[0])
-        ideal_angle = math.atan2(ideal_direction[1], ideal_direction[0])
-        
-        # Handle angle wrapping (e.g., -180 to 180 degrees)
-        angle_diff = ideal_angle - current_angle
-        if angle_diff > math.pi:
-            angle_diff -= 2 * math.pi
-        elif angle_diff < -math.pi:
-            angle_diff += 2 * math.pi
-        
-        # Apply smoothing to the angle change
-        smoothed_angle = current_angle + angle_diff * smoothing_factor
-        
-        # Snap to grid-aligned angles for better visual alignment
+        # Snap to grid-aligned headings for better visual alignment
         # This ensures perfect 90-degree rotations
-        grid_angles = [0, math.pi/2, math.pi, -math.pi/2]  # Right, Down, Left, Up
-        closest_grid_angle = min(grid_angles, key=lambda x: abs(x - smoothed_angle))
-        
-        # If we're close to a grid angle, snap to it
-        if abs(smoothed_angle - closest_grid_angle) < 0.3:  # Within ~17 degrees
-            smoothed_angle = closest_grid_angle
-        
-        # Convert back to direction vector
-        return (math.cos(smoothed_angle), math.sin(smoothed_angle))
+        return snap_to_axis(turn_towards(current_direction, ideal_direction, smoothing_factor))
@@ -0,0 +1,56 @@
+"""
+Disjoint-set forest over road cells in the logistics game.
+Roads are merged as they are placed, so "are these two cells on the same
+network" is a pair of near-constant-time find() calls.
+"""
+
+from typing import Dict, Iterable, Tuple
+
+Coord = Tuple[int, int]
+
+
+class UnionFind:
+    def __init__(self, cells: Iterable[Coord] = ()):
+        self.parent: Dict[Coord, Coord] = {}
+        self.rank: Dict[Coord, int] = {}
+        for cell in cells:
+            self.add_cell(cell)
+
+    def __contains__(self, cell: Coord) -> bool:
+        return cell in self.parent
+
+    def find(self, cell: Coord) -> Coord:
+        """Return the representative of cell's set (cell must have been added)"""
+        parent = self.parent
+        while parent[cell] != cell:
+            # Path halving: point every other node at its grandparent
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    def union(self, a: Coord, b: Coord) -> None:
+        """Merge the sets containing a and b"""
+        ra = self.find(a)
+        rb = self.find(b)
+        if ra == rb:
+            return
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+
+    def add_cell(self, cell: Coord) -> None:
+        """Add a cell and join it to any 4-neighbours already present"""
+        if cell in self.parent:
+            return
+        self.parent[cell] = cell
+        self.rank[cell] = 0
+        x, y = cell
+        for nb in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if nb in self.parent:
+                self.union(cell, nb)
+
+    def connected(self, a: Coord, b: Coord) -> bool:
+        """True when both cells are present and share a set"""
+        return a in self.parent and b in self.parent and self.find(a) == self.find(b)